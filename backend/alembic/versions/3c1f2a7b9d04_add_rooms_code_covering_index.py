@@ -0,0 +1,32 @@
+"""Add covering index for room lookups by code
+
+Revision ID: 3c1f2a7b9d04
+Revises: 9f676f18e6c3
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f2a7b9d04"
+down_revision: Union[str, None] = "9f676f18e6c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_rooms_code_covering",
+        "rooms",
+        ["code"],
+        unique=False,
+        postgresql_include=["id", "status", "max_players"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rooms_code_covering", table_name="rooms")
@@ -0,0 +1,30 @@
+"""Add composite indexes for per-room tank state and projectile queries
+
+Revision ID: 5e8a1d3c7f20
+Revises: 3c1f2a7b9d04
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a1d3c7f20"
+down_revision: Union[str, None] = "3c1f2a7b9d04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tank_states_room_hp", "tank_states", ["room_id", "hp"], unique=False)
+    op.create_index(
+        "ix_projectiles_room_created", "projectiles", ["room_id", "created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projectiles_room_created", table_name="projectiles")
+    op.drop_index("ix_tank_states_room_hp", table_name="tank_states")
@@ -0,0 +1,52 @@
+"""Add stored kd_ratio and win_rate columns to players
+
+Revision ID: 7b4d9e2a6c15
+Revises: 5e8a1d3c7f20
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b4d9e2a6c15"
+down_revision: Union[str, None] = "5e8a1d3c7f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "players",
+        sa.Column("kd_ratio", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "players",
+        sa.Column("win_rate", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE players SET
+            kd_ratio = CASE
+                WHEN deaths = 0 THEN kills
+                ELSE round(kills::numeric / deaths, 2)
+            END,
+            win_rate = CASE
+                WHEN games_played = 0 THEN 0
+                ELSE round(wins::numeric * 100 / games_played, 2)
+            END
+        """
+    )
+    op.create_index(op.f("ix_players_kd_ratio"), "players", ["kd_ratio"], unique=False)
+    op.create_index(op.f("ix_players_win_rate"), "players", ["win_rate"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_players_win_rate"), table_name="players")
+    op.drop_index(op.f("ix_players_kd_ratio"), table_name="players")
+    op.drop_column("players", "win_rate")
+    op.drop_column("players", "kd_ratio")
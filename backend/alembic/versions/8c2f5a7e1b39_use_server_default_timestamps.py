@@ -0,0 +1,39 @@
+"""Stamp created/updated timestamps with server-side now() defaults
+
+Revision ID: 8c2f5a7e1b39
+Revises: 7b4d9e2a6c15
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2f5a7e1b39"
+down_revision: Union[str, None] = "7b4d9e2a6c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    ("players", "created_at"),
+    ("players", "updated_at"),
+    ("rooms", "created_at"),
+    ("rooms", "updated_at"),
+    ("room_memberships", "joined_at"),
+    ("tank_states", "last_updated"),
+    ("projectiles", "created_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -1,8 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api import auth, gameplay, rooms, ws
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(rooms.router, prefix="/rooms", tags=["rooms"])
@@ -1,16 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_player
+from app.api.deps import get_bearer_token, get_current_player
 from app.core import (
     create_access_token,
     create_refresh_token,
-    decode_token,
+    decode_token_cached,
     get_db,
     get_logger,
 )
+from app.core.revocation import is_token_revoked, revoke_token
 from app.models.player import Player
-from app.schemas.auth import LoginRequest, RefreshRequest, TokenResponse
+from app.repositories.player_cache import PlayerSnapshot
+from app.schemas.auth import LoginRequest, LogoutRequest, RefreshRequest, TokenResponse
 from app.schemas.player import PlayerCreate, PlayerResponse
 from app.services.player_service import PlayerService
 
@@ -65,7 +67,8 @@ async def login(
             detail="Invalid username/email or password",
         )
 
-    await service.record_login(player)
+    # One atomic UPDATE on the request session, so it commits before the response.
+    await service.record_login(player.id)
 
     access_token = create_access_token({"sub": str(player.id)})
     refresh_token = create_refresh_token({"sub": str(player.id)})
@@ -88,7 +91,7 @@ async def login(
     summary="Exchange a refresh token for a new access token",
 )
 async def refresh_token(payload: RefreshRequest) -> TokenResponse:
-    token_payload = decode_token(payload.refresh_token)
+    token_payload = decode_token_cached(payload.refresh_token)
     if not token_payload or token_payload.get("type") != "refresh":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
@@ -99,15 +102,34 @@ async def refresh_token(payload: RefreshRequest) -> TokenResponse:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
         )
+    if await is_token_revoked(token_payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked"
+        )
 
+    # Rotate: the presented refresh token can't be exchanged a second time.
+    await revoke_token(token_payload)
     access_token = create_access_token({"sub": str(subject)})
     refresh_token = create_refresh_token({"sub": str(subject)})
     return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
 
-@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, summary="Logout (no-op)")
-async def logout() -> None:
-    return None
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Logout and revoke the presented access and refresh tokens",
+)
+async def logout(request: Request, body: LogoutRequest | None = None) -> Response:
+    token = get_bearer_token(request)
+    payload = decode_token_cached(token) if token else None
+    if payload and payload.get("type") == "access":
+        await revoke_token(payload)
+        logger.info("Player logged out", extra={"player_id": payload.get("sub")})
+    if body is not None and body.refresh_token:
+        refresh_payload = decode_token_cached(body.refresh_token)
+        if refresh_payload and refresh_payload.get("type") == "refresh":
+            await revoke_token(refresh_payload)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get(
@@ -115,5 +137,5 @@ async def logout() -> None:
     response_model=PlayerResponse,
     summary="Get the current authenticated player",
 )
-async def me(current_player: Player = Depends(get_current_player)) -> Player:
+async def me(current_player: PlayerSnapshot = Depends(get_current_player)) -> PlayerSnapshot:
     return current_player
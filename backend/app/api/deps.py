@@ -1,26 +1,32 @@
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core import decode_token, get_db
-from app.models.player import Player
+from app.core import decode_token_cached, get_db
+from app.core.revocation import is_token_revoked
 from app.repositories.player import PlayerRepository
+from app.repositories.player_cache import PlayerSnapshot
 
-bearer_scheme = HTTPBearer(auto_error=False)
+
+def get_bearer_token(request: Request) -> str | None:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if not token or scheme.lower() != "bearer":
+        return None
+    return token
 
 
 async def get_current_player(
-    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> Player:
-    if credentials is None or credentials.scheme.lower() != "bearer":
+) -> PlayerSnapshot:
+    token = get_bearer_token(request)
+    if token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    payload = decode_token(credentials.credentials)
+    payload = decode_token_cached(token)
     if not payload or payload.get("type") != "access":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -28,6 +34,13 @@ async def get_current_player(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if await is_token_revoked(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     subject = payload.get("sub")
     try:
         player_id = int(subject)
@@ -38,7 +51,7 @@ async def get_current_player(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    player = await PlayerRepository(db).get(player_id)
+    player = await PlayerRepository(db).get_snapshot(player_id)
     if not player:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
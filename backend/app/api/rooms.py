@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_player
 from app.core import get_db, get_logger
-from app.models.player import Player
-from app.schemas.room import RoomCreate, RoomDetail, RoomResponse, RoomUpdate
+from app.repositories.player_cache import PlayerSnapshot
+from app.schemas.room import RoomCreate, RoomDetail, RoomResponse, RoomUpdate, from_orm_fast
 from app.services.room_service import RoomService
 
 logger = get_logger(__name__)
@@ -22,9 +23,12 @@ async def list_rooms(
     service = RoomService(db)
     try:
         rooms = await service.get_available_rooms(skip, limit)
-        return rooms
+        # Rows come straight from the DB; returning a response skips response_model validation.
+        return ORJSONResponse(
+            [from_orm_fast(room, member_count).model_dump() for room, member_count in rooms]
+        )
     except Exception as e:
-        logger.error(f"Error listing rooms: {e}")
+        logger.error("Error listing rooms: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list rooms",
@@ -34,7 +38,7 @@ async def list_rooms(
 @router.post("", response_model=RoomResponse, status_code=status.HTTP_201_CREATED)
 async def create_room(
     room_data: RoomCreate,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSnapshot = Depends(get_current_player),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new game room."""
@@ -42,12 +46,13 @@ async def create_room(
     try:
         room = await service.create_room(room_data, current_player.id)
         logger.info(
-            f"Room created: {room.code}",
+            "Room created: %s",
+            room.code,
             extra={"room_code": room.code, "creator_id": current_player.id},
         )
         return room
     except Exception as e:
-        logger.error(f"Error creating room: {e}")
+        logger.error("Error creating room: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create room",
@@ -62,20 +67,13 @@ async def get_room(
     """Get room details by code."""
     service = RoomService(db)
     try:
-        room = await service.get_room_by_code(room_code)
+        room = await service.get_room_with_members_by_code(room_code)
         if not room:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Room not found",
             )
 
-        room_with_members = await service.get_room_with_members(room.id)
-        if not room_with_members:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Room not found",
-            )
-
         members = [
             {
                 "id": m.id,
@@ -86,17 +84,17 @@ async def get_room(
                 "joined_at": m.joined_at,
                 "player_username": m.player.username if m.player else None,
             }
-            for m in room_with_members.memberships
+            for m in room.memberships
         ]
 
         return {
-            **room.model_dump(),
+            **RoomResponse.model_validate(room).model_dump(),
             "members": members,
         }
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting room {room_code}: {e}")
+        logger.error("Error getting room %s: %s", room_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get room",
@@ -106,13 +104,13 @@ async def get_room(
 @router.post("/{room_code}/join", response_model=RoomResponse)
 async def join_room(
     room_code: str,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSnapshot = Depends(get_current_player),
     db: AsyncSession = Depends(get_db),
 ):
     """Join an existing room."""
     service = RoomService(db)
     try:
-        room = await service.get_room_by_code(room_code)
+        room = await service.get_room_with_members_by_code(room_code)
         if not room:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -121,7 +119,8 @@ async def join_room(
 
         await service.join_room(room.id, current_player.id)
         logger.info(
-            f"Player joined room: {room.code}",
+            "Player joined room: %s",
+            room.code,
             extra={"player_id": current_player.id, "room_code": room.code},
         )
         return room
@@ -142,7 +141,7 @@ async def join_room(
                 detail=str(e),
             )
     except Exception as e:
-        logger.error(f"Error joining room {room_code}: {e}")
+        logger.error("Error joining room %s: %s", room_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to join room",
@@ -152,7 +151,7 @@ async def join_room(
 @router.post("/{room_code}/leave", status_code=status.HTTP_204_NO_CONTENT)
 async def leave_room(
     room_code: str,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSnapshot = Depends(get_current_player),
     db: AsyncSession = Depends(get_db),
 ):
     """Leave a room."""
@@ -167,12 +166,13 @@ async def leave_room(
 
         await service.leave_room(room.id, current_player.id)
         logger.info(
-            f"Player left room: {room.code}",
+            "Player left room: %s",
+            room.code,
             extra={"player_id": current_player.id, "room_code": room.code},
         )
         return None
     except Exception as e:
-        logger.error(f"Error leaving room {room_code}: {e}")
+        logger.error("Error leaving room %s: %s", room_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to leave room",
@@ -183,7 +183,7 @@ async def leave_room(
 async def set_ready(
     room_code: str,
     is_ready: bool,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSnapshot = Depends(get_current_player),
     db: AsyncSession = Depends(get_db),
 ):
     """Set player ready status for a room."""
@@ -198,7 +198,7 @@ async def set_ready(
 
         await service.set_player_ready(room.id, current_player.id, is_ready)
         logger.info(
-            f"Player ready status updated",
+            "Player ready status updated",
             extra={
                 "player_id": current_player.id,
                 "room_code": room.code,
@@ -212,7 +212,7 @@ async def set_ready(
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Error setting ready status in room {room_code}: {e}")
+        logger.error("Error setting ready status in room %s: %s", room_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to set ready status",
@@ -222,13 +222,13 @@ async def set_ready(
 @router.post("/{room_code}/start", response_model=RoomResponse)
 async def start_game(
     room_code: str,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSnapshot = Depends(get_current_player),
     db: AsyncSession = Depends(get_db),
 ):
     """Start a game (all players must be ready)."""
     service = RoomService(db)
     try:
-        room = await service.get_room_by_code(room_code)
+        room = await service.get_room_with_members_by_code(room_code)
         if not room:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -237,7 +237,8 @@ async def start_game(
 
         room = await service.start_game(room.id)
         logger.info(
-            f"Game started in room: {room.code}",
+            "Game started in room: %s",
+            room.code,
             extra={"initiated_by": current_player.id, "room_code": room.code},
         )
         return room
@@ -247,7 +248,7 @@ async def start_game(
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Error starting game in room {room_code}: {e}")
+        logger.error("Error starting game in room %s: %s", room_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to start game",
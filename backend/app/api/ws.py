@@ -14,40 +14,99 @@ import json
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocketException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.websockets import WebSocket
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core import decode_token, get_db, get_logger, get_redis
+from app.core import decode_token_cached, get_db, get_logger, get_redis
+from app.core.revocation import is_token_revoked
 from app.models.player import Player
 from app.models.room import Room, RoomStatus
 from app.repositories.player import PlayerRepository
 from app.repositories.room import RoomRepository
-from app.repositories.tank_state import TankStateRepository
+from app.repositories.room_membership import RoomMembershipRepository
 from app.schemas.ws import (
     FireData,
     MessageType,
-    PlayerJoinData,
-    PlayerLeaveData,
-    ScoreboardData,
-    ScoreboardEntry,
+    PlayerJoinEvent,
+    PlayerLeaveEvent,
+    ScoreboardRow,
     TankStateUpdateData,
-    WSMessage,
 )
-from app.ws.manager import WSConnectionManager
+from app.ws.manager import WSConnectionManager, encode_json_message, encode_message
+from app.ws.projectile_sweeper import ProjectileSweeper
+from app.ws.publisher import get_room_publisher
+from app.ws.tank_buffer import TankStateBuffer
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
 ws_managers: dict[str, WSConnectionManager] = {}
+ws_manager_refs: dict[str, int] = {}
+tank_buffers: dict[int, TankStateBuffer] = {}
+projectile_sweepers: dict[int, ProjectileSweeper] = {}
+
+# Hot-path payloads are serialized straight to JSON bytes, skipping the dict dump.
+_TANK_UPDATE_ADAPTER = TypeAdapter(TankStateUpdateData)
+_FIRE_ADAPTER = TypeAdapter(FireData)
 
 
 def get_ws_manager(room_code: str) -> WSConnectionManager:
-    """Get or create WebSocket manager for a room."""
-    if room_code not in ws_managers:
-        redis = get_redis()
-        ws_managers[room_code] = WSConnectionManager(redis)
-    return ws_managers[room_code]
+    """
+    Get or create WebSocket manager for a room.
+
+    Each call holds a reference to the manager until release_ws_manager is called.
+    """
+    manager = ws_managers.get(room_code)
+    if manager is None:
+        manager = ws_managers[room_code] = WSConnectionManager(get_room_publisher())
+    ws_manager_refs[room_code] = ws_manager_refs.get(room_code, 0) + 1
+    return manager
+
+
+def release_ws_manager(room_code: str) -> None:
+    """Drop a reference to a room's manager, evicting it once no handler holds it."""
+    refs = ws_manager_refs.get(room_code, 0) - 1
+    if refs > 0:
+        ws_manager_refs[room_code] = refs
+        return
+    ws_manager_refs.pop(room_code, None)
+    ws_managers.pop(room_code, None)
+
+
+def get_tank_buffer(room_id: int) -> TankStateBuffer:
+    """Get or create the running tank state buffer for a room."""
+    if room_id not in tank_buffers:
+        tank_buffers[room_id] = TankStateBuffer(get_redis(), room_id)
+        tank_buffers[room_id].start()
+    return tank_buffers[room_id]
+
+
+async def release_tank_buffer(room_id: int) -> None:
+    """Stop a room's tank state buffer, flushing any pending states."""
+    tank_buffer = tank_buffers.pop(room_id, None)
+    if tank_buffer is None:
+        return
+    try:
+        await tank_buffer.stop()
+    except Exception as e:
+        logger.error("Error flushing tank states: %s", e, extra={"room_id": room_id})
+
+
+def start_projectile_sweeper(room_id: int) -> None:
+    """Start a room's projectile sweeper unless one is already running."""
+    if room_id not in projectile_sweepers:
+        projectile_sweepers[room_id] = ProjectileSweeper(get_redis(), room_id)
+        projectile_sweepers[room_id].start()
+
+
+async def release_projectile_sweeper(room_id: int) -> None:
+    """Stop a room's projectile sweeper."""
+    sweeper = projectile_sweepers.pop(room_id, None)
+    if sweeper is not None:
+        await sweeper.stop()
 
 
 async def authenticate_ws_token(token: str | None = Query(None)) -> int:
@@ -66,9 +125,11 @@ async def authenticate_ws_token(token: str | None = Query(None)) -> int:
     if not token:
         raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Token required")
 
-    payload = decode_token(token)
+    payload = decode_token_cached(token)
     if not payload or payload.get("type") != "access":
         raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid token")
+    if await is_token_revoked(payload):
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Token revoked")
 
     subject = payload.get("sub")
     try:
@@ -97,18 +158,18 @@ async def websocket_endpoint(
     """
     player_repo = PlayerRepository(db)
     room_repo = RoomRepository(db)
-    tank_repo = TankStateRepository(db)
     manager = get_ws_manager(room_code)
+    tank_buffer: TankStateBuffer | None = None
 
     try:
-        player = await player_repo.get(player_id)
+        player = await player_repo.get_snapshot(player_id)
         if not player:
             await websocket.close(
                 code=status.WS_1008_POLICY_VIOLATION, reason="Player not found"
             )
             return
 
-        room = await room_repo.get_by_code(room_code)
+        room = await room_repo.get_summary_by_code(room_code)
         if not room:
             await websocket.close(
                 code=status.WS_1008_POLICY_VIOLATION, reason="Room not found"
@@ -122,22 +183,20 @@ async def websocket_endpoint(
             return
 
         await manager.connect(websocket, room_code, player_id)
+        tank_buffer = get_tank_buffer(room.id)
+        start_projectile_sweeper(room.id)
 
-        join_msg = WSMessage(
-            type=MessageType.JOIN,
-            data=PlayerJoinData(
-                player_id=player_id,
-                username=player.username,
-                tank_color=None,
-            ).model_dump(),
+        join_msg = encode_message(
+            MessageType.JOIN, PlayerJoinEvent(player_id=player_id, username=player.username)
+        )
+        await manager.broadcast_bytes(
+            room_code, MessageType.JOIN, join_msg, exclude_websocket=websocket
         )
-        await manager.broadcast(room_code, join_msg, exclude_websocket=websocket)
 
-        await websocket.send_text(
-            WSMessage(
-                type=MessageType.JOIN,
-                data={"player_id": player_id, "username": player.username},
-            ).model_dump_json()
+        await websocket.send_bytes(
+            encode_message(
+                MessageType.JOIN, {"player_id": player_id, "username": player.username}
+            )
         )
 
         while True:
@@ -155,20 +214,15 @@ async def websocket_endpoint(
                         )
                         continue
 
-                    tank_state = await tank_repo.get_by_player_and_room(player_id, room.id)
-                    if tank_state:
-                        tank_state.position_x = tank_data.position_x
-                        tank_state.position_y = tank_data.position_y
-                        tank_state.rotation = tank_data.rotation
-                        tank_state.velocity_x = tank_data.velocity_x
-                        tank_state.velocity_y = tank_data.velocity_y
-                        tank_state.hp = tank_data.hp
-                        await tank_repo.update(tank_state)
-
-                    await manager.broadcast(
-                        room_code,
-                        WSMessage(type=MessageType.TANK_STATE_UPDATE, data=tank_data.model_dump()),
+                    # Payload was validated on parse; encode it once for every recipient.
+                    payload = encode_json_message(
+                        MessageType.TANK_STATE_UPDATE, _TANK_UPDATE_ADAPTER.dump_json(tank_data)
                     )
+                    # Newer positions supersede queued ones, so each flush carries one per player.
+                    await manager.broadcast_bytes(
+                        room_code, MessageType.TANK_STATE_UPDATE, payload, coalesce_key=player_id
+                    )
+                    await tank_buffer.put(player_id, tank_data.model_dump(exclude={"player_id"}))
 
                 elif message_type == MessageType.FIRE:
                     fire_data = FireData(**message_data.get("data", {}))
@@ -179,21 +233,23 @@ async def websocket_endpoint(
                         )
                         continue
 
-                    await manager.broadcast(
-                        room_code, WSMessage(type=MessageType.FIRE, data=fire_data.model_dump())
+                    await manager.broadcast_bytes(
+                        room_code,
+                        MessageType.FIRE,
+                        encode_json_message(MessageType.FIRE, _FIRE_ADAPTER.dump_json(fire_data)),
                     )
 
                 else:
-                    logger.warning(f"Unknown message type: {message_type}")
+                    logger.warning("Unknown message type: %s", message_type)
 
             except (json.JSONDecodeError, ValueError) as e:
-                logger.error(f"Error processing message: {e}")
+                logger.error("Error processing message: %s", e)
                 await manager.send_error(
                     websocket, "INVALID_MESSAGE", "Message format is invalid"
                 )
 
     except Exception as e:
-        logger.error(f"WebSocket error: {e}", extra={"player_id": player_id, "room_code": room_code})
+        logger.error("WebSocket error: %s", e, extra={"player_id": player_id, "room_code": room_code})
         manager.disconnect(websocket, room_code)
         if not websocket.client_state.disconnected:
             try:
@@ -201,19 +257,21 @@ async def websocket_endpoint(
             except Exception:
                 pass
     finally:
-        if websocket in manager.connection_player_map:
+        if manager.is_connected(websocket, room_code):
             manager.disconnect(websocket, room_code)
-            leave_msg = WSMessage(
-                type=MessageType.LEAVE,
-                data=PlayerLeaveData(
-                    player_id=player_id,
-                    username=player.username,
-                ).model_dump(),
+            leave_msg = encode_message(
+                MessageType.LEAVE, PlayerLeaveEvent(player_id=player_id, username=player.username)
             )
             try:
-                await manager.broadcast(room_code, leave_msg)
+                await manager.broadcast_bytes(room_code, MessageType.LEAVE, leave_msg)
             except Exception as e:
-                logger.error(f"Error broadcasting leave message: {e}")
+                logger.error("Error broadcasting leave message: %s", e)
+
+        if tank_buffer is not None and manager.get_room_connection_count(room_code) == 0:
+            await release_tank_buffer(room.id)
+            await release_projectile_sweeper(room.id)
+
+        release_ws_manager(room_code)
 
 
 @router.get("/ws/scoreboard/{room_code}")
@@ -225,33 +283,22 @@ async def get_room_scoreboard(
     
     Returns leaderboard entries sorted by kills.
     """
-    room_repo = RoomRepository(db)
-    tank_repo = TankStateRepository(db)
-
-    room = await room_repo.get_by_code(room_code)
+    room = await RoomRepository(db).get_summary_by_code(room_code)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Room not found"
         )
 
-    room_with_members = await room_repo.get_with_members(room.id)
-    if not room_with_members:
-        return {"entries": []}
-
-    entries = []
-    for membership in room_with_members.memberships:
-        player = membership.player
-        tank_state = await tank_repo.get_by_player_and_room(player.id, room.id)
-
-        entry = ScoreboardEntry(
-            player_id=player.id,
-            username=player.username,
-            kills=player.kills,
-            deaths=player.deaths,
-            hp=tank_state.hp if tank_state else 0,
+    rows = await RoomMembershipRepository(db).get_scoreboard(room.id)
+    entries = [
+        ScoreboardRow(
+            player_id=row.player_id,
+            username=row.username,
+            kills=row.kills,
+            deaths=row.deaths,
+            hp=row.hp,
         )
-        entries.append(entry)
-
-    entries.sort(key=lambda e: e.kills, reverse=True)
+        for row in rows
+    ]
 
-    return ScoreboardData(entries=entries)
+    return ORJSONResponse({"entries": entries})
@@ -6,6 +6,8 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    decode_token_cached,
+    decode_token_fast,
     get_password_hash,
     verify_password,
 )
@@ -21,4 +23,6 @@ __all__ = [
     "create_access_token",
     "create_refresh_token",
     "decode_token",
+    "decode_token_cached",
+    "decode_token_fast",
 ]
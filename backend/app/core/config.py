@@ -29,6 +29,10 @@ class Settings(BaseSettings):
     DB_ECHO: bool = False
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    DB_POOL_PRE_PING: bool = True
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
 
     # Redis
     REDIS_URL: RedisDsn = Field(
@@ -36,6 +40,10 @@ class Settings(BaseSettings):
         description="Redis connection URL (redis://host:port/db)",
     )
     REDIS_MAX_CONNECTIONS: int = 10
+    ROOM_CACHE_TTL_SECONDS: int = 60
+    ROOM_LOCAL_CACHE_SIZE: int = 1000
+    ROOM_LOCAL_CACHE_TTL_SECONDS: float = 2.0
+    LEADERBOARD_CACHE_TTL_SECONDS: int = 10
 
     # JWT Authentication
     SECRET_KEY: str = Field(
@@ -45,6 +53,22 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_CACHE_SIZE: int = 10000
+    JWT_CACHE_TTL_SECONDS: int = 5
+    PLAYER_CACHE_SIZE: int = 5000
+    PLAYER_CACHE_TTL_SECONDS: int = 30
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+    REVOCATION_BLOOM_CAPACITY: int = 10000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_BLOOM_REBUILD_SECONDS: float = 300.0
+
+    # Game
+    TANK_FLUSH_INTERVAL_SECONDS: float = 1.5
+    WS_BROADCAST_FLUSH_INTERVAL_SECONDS: float = 0.025
+    WS_BROADCAST_MAX_BATCH: int = 140
+    WS_PUBLISH_QUEUE_SIZE: int = 10000
+    PROJECTILE_SWEEP_INTERVAL_SECONDS: float = 2.0
+    PROJECTILE_MAX_AGE_SECONDS: int = 10
 
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173"]
@@ -18,7 +18,14 @@ engine = create_async_engine(
     echo=settings.DB_ECHO,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    # LIFO checkout keeps reusing the same warm connections and their prepared statements.
+    pool_use_lifo=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    },
 )
 
 AsyncSessionLocal = async_sessionmaker(
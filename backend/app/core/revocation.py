@@ -0,0 +1,151 @@
+"""
+Access and refresh token revocation keyed by JWT ID.
+
+Revoked JTIs live in Redis under auth:revoked:{jti} until the token would have
+expired anyway. Each process also keeps a Bloom filter of revoked JTIs, so the
+common case of a token that was never revoked is answered without a Redis
+round-trip; only filter hits are confirmed against Redis. Revocations are
+announced on the auth:revoked channel to keep every worker's filter current,
+and the filter is rebuilt from the Redis keys on startup and then periodically,
+so bits for revocations whose keys have expired don't accumulate.
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from typing import Any
+
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import get_redis
+
+logger = get_logger(__name__)
+
+REVOKED_KEY_PREFIX = "auth:revoked:"
+REVOKED_CHANNEL = "auth:revoked"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def _new_filter() -> BloomFilter:
+    return BloomFilter(settings.REVOCATION_BLOOM_CAPACITY, settings.REVOCATION_BLOOM_ERROR_RATE)
+
+
+_revoked_jtis = _new_filter()
+# Filter being rebuilt, if any; revocations seen mid-rebuild go into both.
+_pending_jtis: BloomFilter | None = None
+
+
+def _remember(jti: str) -> None:
+    _revoked_jtis.add(jti)
+    if _pending_jtis is not None:
+        _pending_jtis.add(jti)
+
+
+async def is_token_revoked(payload: dict[str, Any]) -> bool:
+    jti = payload.get("jti")
+    if jti is None or jti not in _revoked_jtis:
+        return False
+    return bool(await get_redis().exists(f"{REVOKED_KEY_PREFIX}{jti}"))
+
+
+async def revoke_token(payload: dict[str, Any]) -> None:
+    jti = payload.get("jti")
+    if jti is None:
+        return
+    ttl = int(payload.get("exp", 0) - time.time())
+    if ttl <= 0:
+        return
+    _remember(jti)
+    redis = get_redis()
+    await redis.set(f"{REVOKED_KEY_PREFIX}{jti}", 1, ex=ttl)
+    await redis.publish(REVOKED_CHANNEL, jti)
+
+
+async def load_revoked_tokens(redis: aioredis.Redis) -> int:
+    """Rebuild the filter from the live Redis keys and swap it in."""
+    global _revoked_jtis, _pending_jtis
+    _pending_jtis = _new_filter()
+    count = 0
+    try:
+        async for key in redis.scan_iter(match=f"{REVOKED_KEY_PREFIX}*", count=1000):
+            _pending_jtis.add(key.removeprefix(REVOKED_KEY_PREFIX))
+            count += 1
+        _revoked_jtis = _pending_jtis
+    finally:
+        _pending_jtis = None
+    return count
+
+
+class RevocationListener:
+    """Adds JTIs revoked by other workers to this process's filter."""
+
+    def __init__(self, redis: aioredis.Redis):
+        self.redis = redis
+        self._task: asyncio.Task | None = None
+        self._rebuild_task: asyncio.Task | None = None
+
+    async def start(self):
+        """Subscribe to revocations, then seed the filter from Redis."""
+        if self._task is not None and not self._task.done():
+            return
+        # Subscribe before scanning so a revocation between the two isn't missed.
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(REVOKED_CHANNEL)
+        self._task = asyncio.create_task(self._run(pubsub))
+        count = await load_revoked_tokens(self.redis)
+        logger.info("Loaded %d revoked tokens", count)
+        self._rebuild_task = asyncio.create_task(self._rebuild_periodically())
+
+    async def stop(self):
+        """Stop listening for revocations and rebuilding the filter."""
+        for task in (self._rebuild_task, self._task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._rebuild_task = None
+
+    async def _rebuild_periodically(self):
+        while True:
+            await asyncio.sleep(settings.REVOCATION_BLOOM_REBUILD_SECONDS)
+            try:
+                count = await load_revoked_tokens(self.redis)
+                logger.debug("Rebuilt revocation filter with %d tokens", count)
+            except Exception as e:
+                logger.error("Failed to rebuild revocation filter: %s", e)
+
+    async def _run(self, pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    _remember(message["data"])
+        finally:
+            await pubsub.aclose()
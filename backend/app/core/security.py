@@ -1,12 +1,33 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# Decoded payloads keyed by a digest of the token, never the raw token itself.
+_token_cache: TTLCache = TTLCache(
+    maxsize=settings.JWT_CACHE_SIZE, ttl=settings.JWT_CACHE_TTL_SECONDS
+)
+_token_cache_lock = threading.Lock()
+
+# Keyed HS256 state; copying it skips re-deriving the HMAC pads for every token.
+_HMAC_PROTOTYPE = hmac.new(settings.SECRET_KEY.encode(), digestmod=hashlib.sha256)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -23,7 +44,7 @@ def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta]
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -31,7 +52,7 @@ def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta]
 def create_refresh_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -42,3 +63,60 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
         return payload
     except JWTError:
         return None
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+@lru_cache(maxsize=8)
+def _is_hs256_header(segment: bytes) -> bool:
+    # Our tokens all share one header, so this is decoded once per process.
+    try:
+        header = orjson.loads(_b64url_decode(segment))
+    except (binascii.Error, orjson.JSONDecodeError):
+        return False
+    return isinstance(header, dict) and header.get("alg") == "HS256"
+
+
+def decode_token_fast(token: str) -> Optional[dict[str, Any]]:
+    if settings.ALGORITHM != "HS256":
+        return decode_token(token)
+
+    try:
+        parts = token.encode("ascii").split(b".")
+    except UnicodeEncodeError:
+        return None
+    if len(parts) != 3 or not _is_hs256_header(parts[0]):
+        return None
+
+    h = _HMAC_PROTOTYPE.copy()
+    h.update(parts[0] + b"." + parts[1])
+    expected = base64.urlsafe_b64encode(h.digest()).rstrip(b"=")
+    if not hmac.compare_digest(expected, parts[2]):
+        return None
+
+    try:
+        payload = orjson.loads(_b64url_decode(parts[1]))
+    except (binascii.Error, orjson.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    exp = payload.get("exp")
+    if exp is not None and (not isinstance(exp, (int, float)) or exp < time.time()):
+        return None
+    return payload
+
+
+def decode_token_cached(token: str) -> Optional[dict[str, Any]]:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = decode_token_fast(token)
+    if payload is not None:
+        with _token_cache_lock:
+            _token_cache[key] = payload
+    return payload
@@ -2,10 +2,21 @@
 Collision detection and movement validation for server-side validation.
 """
 
+from typing import Sequence
+
 from app.game.map import (
-    MAP_BOUNDS,
-    OBSTACLES,
-    TANK_RADIUS,
+    GRID_CELL_SIZE,
+    GRID_COLS,
+    GRID_ROWS,
+    MAX_STEP_DISTANCE,
+    MAX_STEP_SQ,
+    MAX_X,
+    MAX_Y,
+    MIN_X,
+    MIN_Y,
+    OBSTACLE_GRID,
+    PROJECTILE_MAX_DIST_SQ,
+    TANK_RADIUS_SQ,
 )
 
 
@@ -20,19 +31,69 @@ def is_valid_position(x: float, y: float) -> bool:
     Returns:
         True if position is valid for tank placement
     """
-    bounds = MAP_BOUNDS
-    if not (bounds.min_x <= x <= bounds.max_x):
+    if not (MIN_X <= x <= MAX_X):
         return False
-    if not (bounds.min_y <= y <= bounds.max_y):
+    if not (MIN_Y <= y <= MAX_Y):
         return False
 
-    for obstacle in OBSTACLES:
-        if obstacle.intersects_circle(x, y, TANK_RADIUS):
+    # grid_cell() inlined: this runs for every validated position.
+    col = int((x - MIN_X) // GRID_CELL_SIZE)
+    row = int((y - MIN_Y) // GRID_CELL_SIZE)
+    if col >= GRID_COLS:
+        col = GRID_COLS - 1
+    if row >= GRID_ROWS:
+        row = GRID_ROWS - 1
+    for min_x, min_y, max_x, max_y in OBSTACLE_GRID[row * GRID_COLS + col]:
+        # Distance outside the box per axis; zero when the centre is within its span.
+        distance_x = max(0.0, min_x - x, x - max_x)
+        distance_y = max(0.0, min_y - y, y - max_y)
+        if distance_x * distance_x + distance_y * distance_y <= TANK_RADIUS_SQ:
             return False
 
     return True
 
 
+def validate_positions_batch(xs: Sequence[float], ys: Sequence[float]) -> list[bool]:
+    """
+    Check many positions at once, e.g. every live projectile of a room per tick.
+
+    Equivalent to calling is_valid_position for each pair, with the map
+    constants bound once for the whole batch instead of per call.
+
+    Args:
+        xs: Position X coordinates
+        ys: Position Y coordinates, same length as xs
+
+    Returns:
+        Validity of each position, in input order
+    """
+    min_bx, min_by, max_bx, max_by = MIN_X, MIN_Y, MAX_X, MAX_Y
+    grid, radius_sq = OBSTACLE_GRID, TANK_RADIUS_SQ
+    cell, last_col, last_row = GRID_CELL_SIZE, GRID_COLS - 1, GRID_ROWS - 1
+
+    results = []
+    append = results.append
+    for x, y in zip(xs, ys):
+        if not (min_bx <= x <= max_bx and min_by <= y <= max_by):
+            append(False)
+            continue
+        col = int((x - min_bx) // cell)
+        row = int((y - min_by) // cell)
+        if col > last_col:
+            col = last_col
+        if row > last_row:
+            row = last_row
+        for min_x, min_y, max_x, max_y in grid[row * GRID_COLS + col]:
+            distance_x = max(0.0, min_x - x, x - max_x)
+            distance_y = max(0.0, min_y - y, y - max_y)
+            if distance_x * distance_x + distance_y * distance_y <= radius_sq:
+                append(False)
+                break
+        else:
+            append(True)
+    return results
+
+
 def validate_movement(
     old_x: float, old_y: float, new_x: float, new_y: float
 ) -> bool:
@@ -48,18 +109,16 @@ def validate_movement(
     Returns:
         True if movement is valid
     """
-    if not is_valid_position(new_x, new_y):
-        return False
-
+    # The step check is a few float ops; reject on it before scanning obstacles.
     distance_x = new_x - old_x
     distance_y = new_y - old_y
-    distance = (distance_x**2 + distance_y**2) ** 0.5
-
-    max_step_distance = 50.0
-    if distance > max_step_distance:
+    # A step longer than the limit on either axis is too long overall.
+    if abs(distance_x) > MAX_STEP_DISTANCE or abs(distance_y) > MAX_STEP_DISTANCE:
+        return False
+    if distance_x * distance_x + distance_y * distance_y > MAX_STEP_SQ:
         return False
 
-    return True
+    return is_valid_position(new_x, new_y)
 
 
 def is_valid_projectile(
@@ -79,6 +138,4 @@ def is_valid_projectile(
     """
     distance_x = proj_x - tank_x
     distance_y = proj_y - tank_y
-    distance = (distance_x**2 + distance_y**2) ** 0.5
-    max_distance = TANK_RADIUS * 2
-    return distance <= max_distance
+    return distance_x * distance_x + distance_y * distance_y <= PROJECTILE_MAX_DIST_SQ
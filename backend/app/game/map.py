@@ -9,10 +9,11 @@ Map Layout:
 - Spawn points: 8 fixed locations for players
 """
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Bounds:
     """Map boundaries."""
 
@@ -22,7 +23,7 @@ class Bounds:
     max_y: float = 600.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rect:
     """Rectangle for obstacles and collision detection."""
 
@@ -30,27 +31,35 @@ class Rect:
     y: float
     width: float
     height: float
+    max_x: float = field(init=False, repr=False)
+    max_y: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Far corner is fixed per obstacle; compute it once instead of per test.
+        object.__setattr__(self, "max_x", self.x + self.width)
+        object.__setattr__(self, "max_y", self.y + self.height)
 
     def contains_point(self, px: float, py: float) -> bool:
         """Check if point is inside rectangle."""
-        return (
-            self.x <= px <= self.x + self.width
-            and self.y <= py <= self.y + self.height
-        )
+        return self.x <= px <= self.max_x and self.y <= py <= self.max_y
 
     def intersects_circle(self, cx: float, cy: float, radius: float) -> bool:
         """Check if circle intersects with rectangle."""
-        closest_x = max(self.x, min(cx, self.x + self.width))
-        closest_y = max(self.y, min(cy, self.y + self.height))
-        distance_x = cx - closest_x
-        distance_y = cy - closest_y
+        distance_x = max(0.0, self.x - cx, cx - self.max_x)
+        distance_y = max(0.0, self.y - cy, cy - self.max_y)
         return (distance_x * distance_x + distance_y * distance_y) <= (
             radius * radius
         )
 
 
 TANK_RADIUS = 15.0
+TANK_RADIUS_SQ = TANK_RADIUS * TANK_RADIUS
+MAX_STEP_DISTANCE = 50.0
+MAX_STEP_SQ = MAX_STEP_DISTANCE * MAX_STEP_DISTANCE
+PROJECTILE_MAX_DIST_SQ = (TANK_RADIUS * 2) ** 2
 MAP_BOUNDS = Bounds()
+MIN_X, MIN_Y = MAP_BOUNDS.min_x, MAP_BOUNDS.min_y
+MAX_X, MAX_Y = MAP_BOUNDS.max_x, MAP_BOUNDS.max_y
 
 OBSTACLES = [
     Rect(100, 100, 100, 50),
@@ -62,6 +71,45 @@ OBSTACLES = [
     Rect(350, 400, 100, 80),
 ]
 
+# Obstacles as plain (min_x, min_y, max_x, max_y) tuples for the collision hot path.
+OBSTACLE_AABBS = tuple((rect.x, rect.y, rect.max_x, rect.max_y) for rect in OBSTACLES)
+
+# Broad phase: a uniform grid over the map where each cell lists the obstacles
+# a tank centred in that cell could touch (obstacles inflated by TANK_RADIUS).
+GRID_CELL_SIZE = 100.0
+GRID_COLS = math.ceil((MAX_X - MIN_X) / GRID_CELL_SIZE)
+GRID_ROWS = math.ceil((MAX_Y - MIN_Y) / GRID_CELL_SIZE)
+
+
+def grid_cell(x: float, y: float) -> int:
+    """Index into OBSTACLE_GRID of the cell containing an in-bounds point."""
+    col = min(int((x - MIN_X) // GRID_CELL_SIZE), GRID_COLS - 1)
+    row = min(int((y - MIN_Y) // GRID_CELL_SIZE), GRID_ROWS - 1)
+    return row * GRID_COLS + col
+
+
+def _build_obstacle_grid() -> tuple[tuple[tuple[float, float, float, float], ...], ...]:
+    cells: list[list[tuple[float, float, float, float]]] = [
+        [] for _ in range(GRID_COLS * GRID_ROWS)
+    ]
+    for aabb in OBSTACLE_AABBS:
+        min_x, min_y, max_x, max_y = aabb
+        first = grid_cell(
+            max(min_x - TANK_RADIUS, MIN_X),
+            max(min_y - TANK_RADIUS, MIN_Y),
+        )
+        last = grid_cell(
+            min(max_x + TANK_RADIUS, MAX_X),
+            min(max_y + TANK_RADIUS, MAX_Y),
+        )
+        for row in range(first // GRID_COLS, last // GRID_COLS + 1):
+            for col in range(first % GRID_COLS, last % GRID_COLS + 1):
+                cells[row * GRID_COLS + col].append(aabb)
+    return tuple(tuple(cell) for cell in cells)
+
+
+OBSTACLE_GRID = _build_obstacle_grid()
+
 SPAWN_POINTS = [
     (50.0, 50.0),
     (750.0, 50.0),
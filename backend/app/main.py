@@ -2,11 +2,16 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import api_router
+from app.api.ws import ws_managers
 from app.core import get_logger, settings, setup_logging
 from app.core.database import close_db, init_db
-from app.core.redis import close_redis, init_redis
+from app.core.redis import close_redis, get_redis, init_redis
+from app.core.revocation import RevocationListener
+from app.ws.publisher import close_room_publisher
+from app.ws.relay import RoomChannelRelay
 
 setup_logging()
 logger = get_logger(__name__)
@@ -15,13 +20,24 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting application...")
+    relay: RoomChannelRelay | None = None
+    revocations: RevocationListener | None = None
     try:
         await init_db()
         await init_redis()
+        revocations = RevocationListener(get_redis())
+        await revocations.start()
+        relay = RoomChannelRelay(get_redis(), ws_managers.get)
+        relay.start()
         logger.info("Application started successfully")
         yield
     finally:
         logger.info("Shutting down application...")
+        if relay is not None:
+            await relay.stop()
+        if revocations is not None:
+            await revocations.stop()
+        await close_room_publisher()
         await close_redis()
         await close_db()
         logger.info("Application shutdown complete")
@@ -33,6 +49,7 @@ def create_app() -> FastAPI:
         version=settings.APP_VERSION,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Float, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 class Player(Base):
     __tablename__ = "players"
+    # Fetch the server-stamped timestamps via RETURNING instead of expiring them.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False)
@@ -27,14 +29,21 @@ class Player(Base):
     wins: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     losses: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     games_played: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Derived from the counters above; stored so leaderboards can sort on an index.
+    kd_ratio: Mapped[float] = mapped_column(
+        Float, default=0.0, server_default="0", nullable=False, index=True
+    )
+    win_rate: Mapped[float] = mapped_column(
+        Float, default=0.0, server_default="0", nullable=False, index=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -48,14 +57,12 @@ class Player(Base):
     def __repr__(self) -> str:
         return f"<Player(id={self.id}, username='{self.username}')>"
 
-    @property
-    def kd_ratio(self) -> float:
+    def refresh_ratios(self) -> None:
         if self.deaths == 0:
-            return float(self.kills)
-        return round(self.kills / self.deaths, 2)
-
-    @property
-    def win_rate(self) -> float:
+            self.kd_ratio = float(self.kills)
+        else:
+            self.kd_ratio = round(self.kills / self.deaths, 2)
         if self.games_played == 0:
-            return 0.0
-        return round((self.wins / self.games_played) * 100, 2)
+            self.win_rate = 0.0
+        else:
+            self.win_rate = round((self.wins / self.games_played) * 100, 2)
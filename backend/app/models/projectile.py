@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 class Projectile(Base):
     __tablename__ = "projectiles"
+    __table_args__ = (Index("ix_projectiles_room_created", "room_id", "created_at"),)
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     room_id: Mapped[int] = mapped_column(
@@ -28,7 +30,7 @@ class Projectile(Base):
     damage: Mapped[int] = mapped_column(Integer, nullable=False, default=25)
     
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     room: Mapped["Room"] = relationship("Room", back_populates="projectiles")
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -16,6 +16,7 @@ class RoomMembership(Base):
     __table_args__ = (
         UniqueConstraint("player_id", "room_id", name="uq_player_room"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     player_id: Mapped[int] = mapped_column(
@@ -29,7 +30,7 @@ class RoomMembership(Base):
     tank_color: Mapped[str | None] = mapped_column(String(20), nullable=True)
     
     joined_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     player: Mapped["Player"] = relationship("Player", back_populates="room_memberships")
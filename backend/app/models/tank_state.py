@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -15,7 +15,9 @@ class TankState(Base):
     __tablename__ = "tank_states"
     __table_args__ = (
         UniqueConstraint("player_id", "room_id", name="uq_tank_player_room"),
+        Index("ix_tank_states_room_hp", "room_id", "hp"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     player_id: Mapped[int] = mapped_column(
@@ -37,8 +39,8 @@ class TankState(Base):
     
     last_updated: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -1,5 +1,6 @@
 from app.repositories.player import PlayerRepository
 from app.repositories.projectile import ProjectileRepository
+from app.repositories.projectile_store import ProjectileRecord, RedisProjectileStore
 from app.repositories.room import RoomRepository
 from app.repositories.room_membership import RoomMembershipRepository
 from app.repositories.tank_state import TankStateRepository
@@ -10,4 +11,6 @@ __all__ = [
     "RoomMembershipRepository",
     "TankStateRepository",
     "ProjectileRepository",
+    "ProjectileRecord",
+    "RedisProjectileStore",
 ]
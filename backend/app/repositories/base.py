@@ -1,6 +1,6 @@
 from typing import Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base
@@ -14,24 +14,39 @@ class BaseRepository(Generic[ModelType]):
         self.db = db
 
     async def get(self, id: int) -> ModelType | None:
-        result = await self.db.execute(select(self.model).where(self.model.id == id))
-        return result.scalar_one_or_none()
+        # Session.get() returns instances already in the identity map without a round-trip.
+        return await self.db.get(self.model, id)
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
         result = await self.db.execute(select(self.model).offset(skip).limit(limit))
         return list(result.scalars().all())
 
+    # create/update/delete commit once per object; use the bulk_* variants in loops.
+    # Sessions don't expire on commit and models fetch server-generated columns via
+    # eager_defaults, so objects are current after commit without a refresh SELECT.
     async def create(self, obj: ModelType) -> ModelType:
         self.db.add(obj)
         await self.db.commit()
-        await self.db.refresh(obj)
         return obj
 
     async def update(self, obj: ModelType) -> ModelType:
         await self.db.commit()
-        await self.db.refresh(obj)
         return obj
 
     async def delete(self, obj: ModelType) -> None:
         await self.db.delete(obj)
         await self.db.commit()
+
+    async def bulk_create(self, objs: list[ModelType]) -> list[ModelType]:
+        if not objs:
+            return objs
+        self.db.add_all(objs)
+        await self.db.commit()
+        return objs
+
+    async def bulk_delete(self, ids: list[int]) -> int:
+        if not ids:
+            return 0
+        result = await self.db.execute(delete(self.model).where(self.model.id.in_(ids)))
+        await self.db.commit()
+        return result.rowcount
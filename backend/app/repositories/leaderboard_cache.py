@@ -0,0 +1,55 @@
+from typing import Any
+
+import orjson
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import get_redis
+
+logger = get_logger(__name__)
+
+LEADERBOARD_CACHE_PREFIX = "lb:"
+
+
+def _get_redis() -> aioredis.Redis | None:
+    try:
+        return get_redis()
+    except RuntimeError:
+        return None
+
+
+def _key(order_by: str, skip: int, limit: int) -> str:
+    return f"{LEADERBOARD_CACHE_PREFIX}{order_by}:{skip}:{limit}"
+
+
+async def get_cached_leaderboard(
+    order_by: str, skip: int, limit: int
+) -> list[dict[str, Any]] | None:
+    redis = _get_redis()
+    if redis is None:
+        return None
+    try:
+        cached = await redis.get(_key(order_by, skip, limit))
+    except Exception as e:
+        logger.error("Error reading leaderboard cache: %s", e, extra={"order_by": order_by})
+        return None
+    if cached is None:
+        return None
+    return orjson.loads(cached)
+
+
+async def cache_leaderboard(
+    order_by: str, skip: int, limit: int, entries: list[dict[str, Any]]
+) -> None:
+    redis = _get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(
+            _key(order_by, skip, limit),
+            orjson.dumps(entries),
+            ex=settings.LEADERBOARD_CACHE_TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.error("Error writing leaderboard cache: %s", e, extra={"order_by": order_by})
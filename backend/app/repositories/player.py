@@ -1,14 +1,61 @@
-from sqlalchemy import func, select
+from sqlalchemy import Numeric, case, cast, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.player import Player
 from app.repositories.base import BaseRepository
+from app.repositories.player_cache import (
+    PlayerSnapshot,
+    cache_player,
+    get_cached_player,
+    invalidate_player,
+)
+
+
+LEADERBOARD_COLUMNS = {
+    "kills": Player.kills,
+    "wins": Player.wins,
+    "games_played": Player.games_played,
+    "kd_ratio": Player.kd_ratio,
+    "win_rate": Player.win_rate,
+}
 
 
 class PlayerRepository(BaseRepository[Player]):
     def __init__(self, db: AsyncSession):
         super().__init__(Player, db)
 
+    async def get_snapshot(self, player_id: int) -> PlayerSnapshot | None:
+        snapshot = get_cached_player(player_id)
+        if snapshot is not None:
+            return snapshot
+        player = await self.get(player_id)
+        if player is None:
+            return None
+        return cache_player(player)
+
+    async def update(self, obj: Player) -> Player:
+        invalidate_player(obj.id)
+        return await super().update(obj)
+
+    async def delete(self, obj: Player) -> None:
+        invalidate_player(obj.id)
+        await super().delete(obj)
+
+    async def record_login(self, player_id: int) -> Player | None:
+        # Single atomic UPDATE; concurrent logins can't lose an increment. RETURNING
+        # refreshes an instance this session already holds, as in update_stats.
+        invalidate_player(player_id)
+        result = await self.db.execute(
+            update(Player)
+            .where(Player.id == player_id)
+            .values(last_login_at=func.now(), login_count=Player.login_count + 1)
+            .returning(Player)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        player = result.scalar_one_or_none()
+        await self.db.commit()
+        return player
+
     async def get_by_username(self, username: str) -> Player | None:
         result = await self.db.execute(select(Player).where(Player.username == username))
         return result.scalar_one_or_none()
@@ -26,7 +73,7 @@ class PlayerRepository(BaseRepository[Player]):
     async def get_leaderboard(
         self, order_by: str = "kills", skip: int = 0, limit: int = 100
     ) -> list[Player]:
-        order_column = getattr(Player, order_by, Player.kills)
+        order_column = LEADERBOARD_COLUMNS.get(order_by, Player.kills)
         result = await self.db.execute(
             select(Player).order_by(order_column.desc()).offset(skip).limit(limit)
         )
@@ -36,7 +83,7 @@ class PlayerRepository(BaseRepository[Player]):
         result = await self.db.execute(
             select(Player)
             .where(Player.deaths > 0)
-            .order_by((Player.kills / Player.deaths).desc())
+            .order_by(Player.kd_ratio.desc())
             .limit(limit)
         )
         return list(result.scalars().all())
@@ -59,9 +106,34 @@ class PlayerRepository(BaseRepository[Player]):
         wins: int = 0,
         losses: int = 0,
     ) -> Player:
-        player.kills += kills
-        player.deaths += deaths
-        player.wins += wins
-        player.losses += losses
-        player.games_played += 1 if (wins + losses) > 0 else 0
-        return await self.update(player)
+        # Increments and ratios are computed in one UPDATE from the stored counters, so
+        # concurrent results can't overwrite each other; mirrors Player.refresh_ratios.
+        new_kills = Player.kills + kills
+        new_deaths = Player.deaths + deaths
+        new_wins = Player.wins + wins
+        new_games = Player.games_played + (1 if (wins + losses) > 0 else 0)
+        invalidate_player(player.id)
+        result = await self.db.execute(
+            update(Player)
+            .where(Player.id == player.id)
+            .values(
+                kills=new_kills,
+                deaths=new_deaths,
+                wins=new_wins,
+                losses=Player.losses + losses,
+                games_played=new_games,
+                kd_ratio=case(
+                    (new_deaths == 0, new_kills),
+                    else_=func.round(cast(new_kills, Numeric) / new_deaths, 2),
+                ),
+                win_rate=case(
+                    (new_games == 0, 0),
+                    else_=func.round(cast(new_wins, Numeric) * 100 / new_games, 2),
+                ),
+            )
+            .returning(Player)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        player = result.scalar_one()
+        await self.db.commit()
+        return player
@@ -0,0 +1,66 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+from app.models.player import Player
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerSnapshot:
+    """Detached, read-only copy of the player fields authenticated routes need."""
+
+    id: int
+    username: str
+    email: str
+    last_login_at: datetime | None
+    login_count: int
+    kills: int
+    deaths: int
+    wins: int
+    losses: int
+    games_played: int
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_player(cls, player: Player) -> "PlayerSnapshot":
+        return cls(
+            id=player.id,
+            username=player.username,
+            email=player.email,
+            last_login_at=player.last_login_at,
+            login_count=player.login_count,
+            kills=player.kills,
+            deaths=player.deaths,
+            wins=player.wins,
+            losses=player.losses,
+            games_played=player.games_played,
+            created_at=player.created_at,
+            updated_at=player.updated_at,
+        )
+
+
+_player_cache: TTLCache = TTLCache(
+    maxsize=settings.PLAYER_CACHE_SIZE, ttl=settings.PLAYER_CACHE_TTL_SECONDS
+)
+_player_cache_lock = threading.Lock()
+
+
+def get_cached_player(player_id: int) -> PlayerSnapshot | None:
+    with _player_cache_lock:
+        return _player_cache.get(player_id)
+
+
+def cache_player(player: Player) -> PlayerSnapshot:
+    snapshot = PlayerSnapshot.from_player(player)
+    with _player_cache_lock:
+        _player_cache[player.id] = snapshot
+    return snapshot
+
+
+def invalidate_player(player_id: int) -> None:
+    with _player_cache_lock:
+        _player_cache.pop(player_id, None)
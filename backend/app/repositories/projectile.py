@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.projectile import Projectile
@@ -11,6 +12,17 @@ class ProjectileRepository(BaseRepository[Projectile]):
     def __init__(self, db: AsyncSession):
         super().__init__(Projectile, db)
 
+    async def create_many(self, items: list[dict[str, Any]]) -> list[int]:
+        if not items:
+            return []
+        # Batched into multi-row INSERT ... VALUES statements (insertmanyvalues).
+        result = await self.db.execute(
+            insert(Projectile).returning(Projectile.id, sort_by_parameter_order=True), items
+        )
+        ids = list(result.scalars().all())
+        await self.db.commit()
+        return ids
+
     async def get_by_room(self, room_id: int) -> list[Projectile]:
         result = await self.db.execute(
             select(Projectile).where(Projectile.room_id == room_id)
@@ -25,15 +37,14 @@ class ProjectileRepository(BaseRepository[Projectile]):
 
     async def delete_old_projectiles(self, room_id: int, max_age_seconds: int = 10) -> int:
         cutoff_time = datetime.utcnow() - timedelta(seconds=max_age_seconds)
-        projectiles = await self.get_by_room(room_id)
-        deleted_count = 0
-        for projectile in projectiles:
-            if projectile.created_at < cutoff_time:
-                await self.delete(projectile)
-                deleted_count += 1
-        return deleted_count
+        result = await self.db.execute(
+            delete(Projectile).where(
+                Projectile.room_id == room_id, Projectile.created_at < cutoff_time
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
 
     async def delete_by_room(self, room_id: int) -> None:
-        projectiles = await self.get_by_room(room_id)
-        for projectile in projectiles:
-            await self.delete(projectile)
+        await self.db.execute(delete(Projectile).where(Projectile.room_id == room_id))
+        await self.db.commit()
@@ -0,0 +1,168 @@
+"""
+Redis-backed store for in-flight projectiles.
+
+Projectiles live for a few seconds and change every tick, so they are kept in
+Redis instead of PostgreSQL: one hash per projectile at room:{id}:proj:{pid}
+plus a sorted set room:{id}:proj indexing projectile ids by creation time.
+Rows are only written to the projectiles table when a room's state is
+persisted at the end of a game.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from redis import asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.projectile import ProjectileRepository
+
+
+@dataclass(slots=True)
+class ProjectileRecord:
+    """In-flight projectile as held in Redis."""
+
+    id: int
+    room_id: int
+    shooter_player_id: int
+    position_x: float
+    position_y: float
+    velocity_x: float
+    velocity_y: float
+    damage: int
+    created_at: datetime
+
+    @classmethod
+    def from_hash(
+        cls, room_id: int, projectile_id: int, data: dict[str, str]
+    ) -> "ProjectileRecord":
+        return cls(
+            id=projectile_id,
+            room_id=room_id,
+            shooter_player_id=int(data["shooter_player_id"]),
+            position_x=float(data["position_x"]),
+            position_y=float(data["position_y"]),
+            velocity_x=float(data["velocity_x"]),
+            velocity_y=float(data["velocity_y"]),
+            damage=int(data["damage"]),
+            created_at=datetime.fromtimestamp(float(data["created_at"]), tz=timezone.utc),
+        )
+
+
+class RedisProjectileStore:
+    def __init__(self, redis: aioredis.Redis):
+        self.redis = redis
+
+    @staticmethod
+    def _index_key(room_id: int) -> str:
+        return f"room:{room_id}:proj"
+
+    @staticmethod
+    def _key(room_id: int, projectile_id: int | str) -> str:
+        return f"room:{room_id}:proj:{projectile_id}"
+
+    async def create(
+        self,
+        room_id: int,
+        shooter_player_id: int,
+        position_x: float,
+        position_y: float,
+        velocity_x: float,
+        velocity_y: float,
+        damage: int,
+    ) -> ProjectileRecord:
+        projectile_id = await self.redis.incr(f"{self._index_key(room_id)}:seq")
+        created_at = datetime.now(timezone.utc)
+        mapping = {
+            "shooter_player_id": shooter_player_id,
+            "position_x": position_x,
+            "position_y": position_y,
+            "velocity_x": velocity_x,
+            "velocity_y": velocity_y,
+            "damage": damage,
+            "created_at": created_at.timestamp(),
+        }
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(self._key(room_id, projectile_id), mapping=mapping)
+            pipe.zadd(self._index_key(room_id), {projectile_id: created_at.timestamp()})
+            await pipe.execute()
+        return ProjectileRecord(
+            id=projectile_id,
+            room_id=room_id,
+            shooter_player_id=shooter_player_id,
+            position_x=position_x,
+            position_y=position_y,
+            velocity_x=velocity_x,
+            velocity_y=velocity_y,
+            damage=damage,
+            created_at=created_at,
+        )
+
+    async def get_by_room(self, room_id: int) -> list[ProjectileRecord]:
+        projectile_ids = await self.redis.zrange(self._index_key(room_id), 0, -1)
+        if not projectile_ids:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for projectile_id in projectile_ids:
+                pipe.hgetall(self._key(room_id, projectile_id))
+            rows = await pipe.execute()
+        return [
+            ProjectileRecord.from_hash(room_id, int(projectile_id), data)
+            for projectile_id, data in zip(projectile_ids, rows)
+            if data
+        ]
+
+    async def update_positions(
+        self, room_id: int, positions: dict[int, tuple[float, float]]
+    ) -> None:
+        if not positions:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for projectile_id, (x, y) in positions.items():
+                pipe.hset(
+                    self._key(room_id, projectile_id),
+                    mapping={"position_x": x, "position_y": y},
+                )
+            await pipe.execute()
+
+    async def delete(self, room_id: int, projectile_ids: list[int]) -> None:
+        if not projectile_ids:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(*(self._key(room_id, projectile_id) for projectile_id in projectile_ids))
+            pipe.zrem(self._index_key(room_id), *projectile_ids)
+            await pipe.execute()
+
+    async def delete_old(self, room_id: int, max_age_seconds: int = 10) -> int:
+        cutoff = datetime.now(timezone.utc).timestamp() - max_age_seconds
+        expired = await self.redis.zrangebyscore(self._index_key(room_id), "-inf", f"({cutoff}")
+        await self.delete(room_id, [int(projectile_id) for projectile_id in expired])
+        return len(expired)
+
+    async def delete_by_room(self, room_id: int) -> None:
+        projectile_ids = await self.redis.zrange(self._index_key(room_id), 0, -1)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if projectile_ids:
+                pipe.delete(*(self._key(room_id, pid) for pid in projectile_ids))
+            pipe.delete(self._index_key(room_id), f"{self._index_key(room_id)}:seq")
+            await pipe.execute()
+
+    async def persist_room(self, db: AsyncSession, room_id: int) -> int:
+        """Write a room's live projectiles to PostgreSQL and clear them from Redis."""
+        records = await self.get_by_room(room_id)
+        await ProjectileRepository(db).create_many(
+            [
+                {
+                    "room_id": record.room_id,
+                    "shooter_player_id": record.shooter_player_id,
+                    "position_x": record.position_x,
+                    "position_y": record.position_y,
+                    "velocity_x": record.velocity_x,
+                    "velocity_y": record.velocity_y,
+                    "damage": record.damage,
+                    "created_at": record.created_at,
+                }
+                for record in records
+            ]
+        )
+        await self.delete_by_room(room_id)
+        return len(records)
@@ -1,10 +1,14 @@
-from sqlalchemy import select
+from sqlalchemy import delete, exists, false, func, inspect, literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 from app.models.room import Room, RoomStatus
 from app.models.room_membership import RoomMembership
 from app.repositories.base import BaseRepository
+from app.repositories.room_cache import RoomSummary, cache_room, get_cached_room, invalidate_room
 
 
 class RoomRepository(BaseRepository[Room]):
@@ -15,6 +19,123 @@ class RoomRepository(BaseRepository[Room]):
         result = await self.db.execute(select(Room).where(Room.code == code))
         return result.scalar_one_or_none()
 
+    async def get_minimal_by_code(self, code: str) -> RoomSummary | None:
+        # Only columns held by ix_rooms_code_covering, so Postgres can skip the heap.
+        result = await self.db.execute(
+            select(Room.id, Room.code, Room.status, Room.max_players)
+            .where(Room.code == code)
+            .limit(1)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return RoomSummary(id=row.id, code=row.code, status=row.status, max_players=row.max_players)
+
+    async def get_summary_by_code(self, code: str) -> RoomSummary | None:
+        summary = await get_cached_room(code)
+        if summary is not None:
+            return summary
+        summary = await self.get_minimal_by_code(code)
+        if summary is None:
+            return None
+        return await cache_room(summary)
+
+    async def update(self, obj: Room) -> Room:
+        await invalidate_room(obj.code)
+        return await super().update(obj)
+
+    async def delete(self, obj: Room) -> None:
+        await invalidate_room(obj.code)
+        await super().delete(obj)
+
+    async def try_insert(self, code: str, name: str, max_players: int) -> Room | None:
+        # The unique index on code settles collisions; None means the code was taken.
+        result = await self.db.execute(
+            insert(Room)
+            .values(code=code, name=name, max_players=max_players, status=RoomStatus.WAITING)
+            .on_conflict_do_nothing(index_elements=[Room.code])
+            .returning(Room)
+        )
+        room = result.scalar_one_or_none()
+        await self.db.commit()
+        return room
+
+    async def add_member(self, room_id: int, player_id: int) -> RoomMembership | None:
+        # Lock the room row first. Concurrent joins queue on it, and under READ COMMITTED
+        # the INSERT below takes a fresh snapshot once the lock is held, so its count
+        # includes every join committed ahead of it. A CTE lock in the same statement
+        # would not help: the count would still read the statement's starting snapshot.
+        locked = await self.db.execute(
+            select(Room.id)
+            .where(Room.id == room_id, Room.status == RoomStatus.WAITING)
+            .with_for_update()
+        )
+        if locked.scalar_one_or_none() is None:
+            await self.db.commit()
+            return None
+
+        # Capacity and duplicate checks run inside the INSERT; None means one of them
+        # rejected the join.
+        member_count = (
+            select(func.count())
+            .select_from(RoomMembership)
+            .where(RoomMembership.room_id == room_id)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            insert(RoomMembership)
+            .from_select(
+                ["player_id", "room_id", "is_ready"],
+                select(literal(player_id), Room.id, false()).where(
+                    Room.id == room_id,
+                    Room.status == RoomStatus.WAITING,
+                    member_count < Room.max_players,
+                ),
+            )
+            .on_conflict_do_nothing(constraint="uq_player_room")
+            .returning(RoomMembership.id)
+        )
+        membership_id = result.scalar_one_or_none()
+        await self.db.commit()
+        if membership_id is None:
+            return None
+
+        membership = await self.db.get(RoomMembership, membership_id)
+        # Keep an already loaded member list in step without reloading it.
+        room = self.db.identity_map.get(identity_key(Room, room_id))
+        if room is not None and "memberships" not in inspect(room).unloaded:
+            set_committed_value(room, "memberships", [*room.memberships, membership])
+        return membership
+
+    async def remove_member(self, room_id: int, player_id: int) -> bool:
+        # One statement: drop the membership, and the room too if nobody else is left.
+        # The NOT EXISTS sees the pre-statement snapshot, hence the player_id filter.
+        left = (
+            delete(RoomMembership)
+            .where(RoomMembership.player_id == player_id, RoomMembership.room_id == room_id)
+            .returning(RoomMembership.room_id)
+            .cte("left_member")
+        )
+        others = exists().where(
+            RoomMembership.room_id == room_id, RoomMembership.player_id != player_id
+        )
+        result = await self.db.execute(
+            delete(Room)
+            .where(Room.id.in_(select(left.c.room_id)), ~others)
+            .returning(Room.code)
+            .execution_options(synchronize_session=False)
+        )
+        code = result.scalar_one_or_none()
+        await self.db.commit()
+        if code is None:
+            return False
+
+        await invalidate_room(code)
+        room = self.db.identity_map.get(identity_key(Room, room_id))
+        if room is not None:
+            self.db.expunge(room)
+        return True
+
     async def get_with_members(self, room_id: int) -> Room | None:
         result = await self.db.execute(
             select(Room)
@@ -23,6 +144,14 @@ class RoomRepository(BaseRepository[Room]):
         )
         return result.scalar_one_or_none()
 
+    async def get_with_members_by_code(self, code: str) -> Room | None:
+        result = await self.db.execute(
+            select(Room)
+            .where(Room.code == code)
+            .options(joinedload(Room.memberships).joinedload(RoomMembership.player))
+        )
+        return result.unique().scalar_one_or_none()
+
     async def get_by_status(
         self, status: RoomStatus, skip: int = 0, limit: int = 100
     ) -> list[Room]:
@@ -31,16 +160,23 @@ class RoomRepository(BaseRepository[Room]):
         )
         return list(result.scalars().all())
 
-    async def get_available_rooms(self, skip: int = 0, limit: int = 100) -> list[Room]:
+    async def get_available_rooms(self, skip: int = 0, limit: int = 100) -> list[tuple[Room, int]]:
+        # Count members in SQL so full rooms are filtered before OFFSET/LIMIT apply.
+        member_counts = (
+            select(RoomMembership.room_id, func.count().label("member_count"))
+            .group_by(RoomMembership.room_id)
+            .subquery()
+        )
+        member_count = func.coalesce(member_counts.c.member_count, 0)
         result = await self.db.execute(
-            select(Room)
-            .where(Room.status == RoomStatus.WAITING)
-            .options(selectinload(Room.memberships))
+            select(Room, member_count)
+            .outerjoin(member_counts, member_counts.c.room_id == Room.id)
+            .where(Room.status == RoomStatus.WAITING, member_count < Room.max_players)
+            .order_by(Room.id)
             .offset(skip)
             .limit(limit)
         )
-        rooms = list(result.scalars().all())
-        return [room for room in rooms if not room.is_full]
+        return [(room, count) for room, count in result.all()]
 
     async def get_player_room(self, player_id: int) -> Room | None:
         result = await self.db.execute(
@@ -0,0 +1,108 @@
+import json
+import threading
+from dataclasses import dataclass
+
+from cachetools import TTLCache
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import get_redis
+from app.models.room import Room, RoomStatus
+
+logger = get_logger(__name__)
+
+ROOM_CACHE_PREFIX = "room:code:"
+
+
+@dataclass(slots=True, frozen=True)
+class RoomSummary:
+    """Room metadata needed on the WebSocket handshake path."""
+
+    id: int
+    code: str
+    status: RoomStatus
+    max_players: int
+
+    @classmethod
+    def from_room(cls, room: Room) -> "RoomSummary":
+        return cls(id=room.id, code=room.code, status=room.status, max_players=room.max_players)
+
+
+# Connect bursts hit the same few rooms, so a short in-process layer sits in front of
+# Redis. Invalidation only reaches this process; the TTL bounds staleness elsewhere.
+_local_rooms: TTLCache = TTLCache(
+    maxsize=settings.ROOM_LOCAL_CACHE_SIZE, ttl=settings.ROOM_LOCAL_CACHE_TTL_SECONDS
+)
+_local_rooms_lock = threading.Lock()
+
+
+def _get_redis() -> aioredis.Redis | None:
+    # The cache is best-effort: callers without an initialized client just hit the DB.
+    try:
+        return get_redis()
+    except RuntimeError:
+        return None
+
+
+async def get_cached_room(code: str) -> RoomSummary | None:
+    with _local_rooms_lock:
+        summary = _local_rooms.get(code)
+    if summary is not None:
+        return summary
+    redis = _get_redis()
+    if redis is None:
+        return None
+    try:
+        cached = await redis.get(f"{ROOM_CACHE_PREFIX}{code}")
+    except Exception as e:
+        logger.error("Error reading room cache: %s", e, extra={"room_code": code})
+        return None
+    if cached is None:
+        return None
+    data = json.loads(cached)
+    summary = RoomSummary(
+        id=data["id"],
+        code=data["code"],
+        status=RoomStatus(data["status"]),
+        max_players=data["max_players"],
+    )
+    with _local_rooms_lock:
+        _local_rooms[code] = summary
+    return summary
+
+
+async def cache_room(room: Room | RoomSummary) -> RoomSummary:
+    summary = room if isinstance(room, RoomSummary) else RoomSummary.from_room(room)
+    with _local_rooms_lock:
+        _local_rooms[summary.code] = summary
+    redis = _get_redis()
+    if redis is None:
+        return summary
+    payload = json.dumps(
+        {
+            "id": summary.id,
+            "code": summary.code,
+            "status": summary.status.value,
+            "max_players": summary.max_players,
+        }
+    )
+    try:
+        await redis.set(
+            f"{ROOM_CACHE_PREFIX}{summary.code}", payload, ex=settings.ROOM_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.error("Error writing room cache: %s", e, extra={"room_code": summary.code})
+    return summary
+
+
+async def invalidate_room(code: str) -> None:
+    with _local_rooms_lock:
+        _local_rooms.pop(code, None)
+    redis = _get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(f"{ROOM_CACHE_PREFIX}{code}")
+    except Exception as e:
+        logger.error("Error invalidating room cache: %s", e, extra={"room_code": code})
@@ -1,7 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import Row, and_, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.player import Player
 from app.models.room_membership import RoomMembership
+from app.models.tank_state import TankState
 from app.repositories.base import BaseRepository
 
 
@@ -33,9 +35,43 @@ class RoomMembershipRepository(BaseRepository[RoomMembership]):
 
     async def count_by_room(self, room_id: int) -> int:
         result = await self.db.execute(
-            select(RoomMembership).where(RoomMembership.room_id == room_id)
+            select(func.count())
+            .select_from(RoomMembership)
+            .where(RoomMembership.room_id == room_id)
+        )
+        return result.scalar_one()
+
+    async def get_scoreboard(self, room_id: int) -> list[Row]:
+        # Only the scoreboard columns, in one query, instead of loading members,
+        # players and tank states as ORM objects.
+        result = await self.db.execute(
+            select(
+                Player.id.label("player_id"),
+                Player.username,
+                Player.kills,
+                Player.deaths,
+                func.coalesce(TankState.hp, 0).label("hp"),
+            )
+            .select_from(RoomMembership)
+            .join(Player, Player.id == RoomMembership.player_id)
+            .outerjoin(
+                TankState,
+                and_(TankState.player_id == Player.id, TankState.room_id == room_id),
+            )
+            .where(RoomMembership.room_id == room_id)
+            .order_by(Player.kills.desc())
+        )
+        return list(result.all())
+
+    async def has_unready(self, room_id: int) -> bool:
+        result = await self.db.execute(
+            select(
+                exists().where(
+                    RoomMembership.room_id == room_id, RoomMembership.is_ready.is_(False)
+                )
+            )
         )
-        return len(list(result.scalars().all()))
+        return result.scalar_one()
 
     async def delete_by_player_and_room(self, player_id: int, room_id: int) -> None:
         membership = await self.get_by_player_and_room(player_id, room_id)
@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import bindparam, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tank_state import TankState
@@ -25,6 +27,23 @@ class TankStateRepository(BaseRepository[TankState]):
         )
         return list(result.scalars().all())
 
+    async def get_for_room(self, room_id: int) -> dict[int, TankState]:
+        tanks = await self.get_by_room(room_id)
+        return {tank.player_id: tank for tank in tanks}
+
+    async def bulk_update_states(self, room_id: int, states: dict[int, dict[str, Any]]) -> None:
+        if not states:
+            return
+        table = TankState.__table__
+        stmt = update(table).where(
+            table.c.room_id == room_id, table.c.player_id == bindparam("b_player_id")
+        )
+        await self.db.execute(
+            stmt,
+            [{"b_player_id": player_id, **fields} for player_id, fields in states.items()],
+        )
+        await self.db.commit()
+
     async def get_alive_by_room(self, room_id: int) -> list[TankState]:
         result = await self.db.execute(
             select(TankState).where(TankState.room_id == room_id, TankState.hp > 0)
@@ -32,6 +51,5 @@ class TankStateRepository(BaseRepository[TankState]):
         return list(result.scalars().all())
 
     async def delete_by_room(self, room_id: int) -> None:
-        tanks = await self.get_by_room(room_id)
-        for tank in tanks:
-            await self.delete(tank)
+        await self.db.execute(delete(TankState).where(TankState.room_id == room_id))
+        await self.db.commit()
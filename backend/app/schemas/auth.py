@@ -18,3 +18,7 @@ class LoginResponse(TokenResponse):
 
 class RefreshRequest(BaseModel):
     refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
@@ -1,11 +1,21 @@
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field, StringConstraints
+
+# A structural check is enough here; EmailStr would import email-validator into
+# every worker for a field the game never mails. Lowercased so the unique index
+# treats Foo@X.com and foo@x.com as the same address.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+Email = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, to_lower=True, max_length=254, pattern=EMAIL_PATTERN),
+]
 
 
 class PlayerBase(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
-    email: EmailStr
+    email: Email
 
 
 class PlayerCreate(PlayerBase):
@@ -13,7 +23,7 @@ class PlayerCreate(PlayerBase):
 
 
 class PlayerUpdate(BaseModel):
-    email: EmailStr | None = None
+    email: Email | None = None
     password: str | None = Field(None, min_length=8, max_length=100)
 
 
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from app.models.room import RoomStatus
+from app.models.room import Room, RoomStatus
 
 
 class RoomBase(BaseModel):
@@ -33,6 +33,28 @@ class RoomResponse(RoomBase):
     model_config = {"from_attributes": True}
 
 
+def from_orm_fast(room: Room, current_players: int | None = None) -> RoomResponse:
+    """
+    Build a RoomResponse from a Room without re-validating trusted DB data.
+
+    Pass current_players when it was counted in SQL; otherwise memberships must be loaded.
+    """
+    if current_players is None:
+        current_players = len(room.memberships)
+    return RoomResponse.model_construct(
+        id=room.id,
+        name=room.name,
+        code=room.code,
+        status=room.status,
+        max_players=room.max_players,
+        current_players=current_players,
+        is_full=current_players >= room.max_players,
+        can_start=current_players >= 2 and room.status == RoomStatus.WAITING,
+        created_at=room.created_at,
+        updated_at=room.updated_at,
+    )
+
+
 class RoomMembershipBase(BaseModel):
     is_ready: bool = False
     tank_color: str | None = None
@@ -15,8 +15,10 @@ Message Types:
   fire: Projectile creation
   scoreboard: Periodic leaderboard update
   error: Server error response
+  batch: Several queued server messages delivered in one frame
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -32,6 +34,7 @@ class MessageType(str, Enum):
     FIRE = "fire"
     SCOREBOARD = "scoreboard"
     ERROR = "error"
+    BATCH = "batch"
 
 
 class WSMessage(BaseModel):
@@ -101,3 +104,35 @@ class ErrorData(BaseModel):
 
     code: str
     message: str
+
+
+# Outbound payloads the server builds itself never need validation, so they are
+# plain slotted dataclasses that orjson serializes directly.
+
+
+@dataclass(slots=True)
+class PlayerJoinEvent:
+    """Outbound join payload; mirrors PlayerJoinData."""
+
+    player_id: int
+    username: str
+    tank_color: str | None = None
+
+
+@dataclass(slots=True)
+class PlayerLeaveEvent:
+    """Outbound leave payload; mirrors PlayerLeaveData."""
+
+    player_id: int
+    username: str
+
+
+@dataclass(slots=True)
+class ScoreboardRow:
+    """Outbound scoreboard entry; mirrors ScoreboardEntry."""
+
+    player_id: int
+    username: str
+    kills: int
+    deaths: int
+    hp: int
@@ -1,17 +1,21 @@
+from redis import asyncio as aioredis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.projectile import Projectile
+from app.core.redis import get_redis
 from app.models.tank_state import TankState
 from app.repositories.projectile import ProjectileRepository
+from app.repositories.projectile_store import ProjectileRecord, RedisProjectileStore
 from app.repositories.tank_state import TankStateRepository
 from app.schemas.projectile import ProjectileCreate
 from app.schemas.tank import TankMovement, TankStateCreate, TankStateUpdate
 
 
 class GameService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: aioredis.Redis | None = None):
+        self.db = db
         self.tank_repo = TankStateRepository(db)
         self.projectile_repo = ProjectileRepository(db)
+        self.projectile_store = RedisProjectileStore(redis if redis is not None else get_redis())
 
     async def create_tank_state(self, tank_data: TankStateCreate) -> TankState:
         existing = await self.tank_repo.get_by_player_and_room(
@@ -52,18 +56,12 @@ class GameService:
     async def update_tank_state(
         self, tank: TankState, update_data: TankStateUpdate
     ) -> TankState:
-        if update_data.position_x is not None:
-            tank.position_x = update_data.position_x
-        if update_data.position_y is not None:
-            tank.position_y = update_data.position_y
-        if update_data.rotation is not None:
-            tank.rotation = update_data.rotation
-        if update_data.velocity_x is not None:
-            tank.velocity_x = update_data.velocity_x
-        if update_data.velocity_y is not None:
-            tank.velocity_y = update_data.velocity_y
-        if update_data.hp is not None:
-            tank.hp = max(0, min(update_data.hp, tank.max_hp))
+        fields = update_data.model_dump(exclude_unset=True, exclude_none=True)
+        hp = fields.pop("hp", None)
+        for name, value in fields.items():
+            setattr(tank, name, value)
+        if hp is not None:
+            tank.hp = max(0, min(hp, tank.max_hp))
 
         return await self.tank_repo.update(tank)
 
@@ -71,8 +69,8 @@ class GameService:
         tank.hp = max(0, tank.hp - damage)
         return await self.tank_repo.update(tank)
 
-    async def create_projectile(self, projectile_data: ProjectileCreate) -> Projectile:
-        projectile = Projectile(
+    async def create_projectile(self, projectile_data: ProjectileCreate) -> ProjectileRecord:
+        return await self.projectile_store.create(
             room_id=projectile_data.room_id,
             shooter_player_id=projectile_data.shooter_player_id,
             position_x=projectile_data.position_x,
@@ -81,13 +79,15 @@ class GameService:
             velocity_y=projectile_data.velocity_y,
             damage=projectile_data.damage,
         )
-        return await self.projectile_repo.create(projectile)
 
-    async def get_room_projectiles(self, room_id: int) -> list[Projectile]:
-        return await self.projectile_repo.get_by_room(room_id)
+    async def get_room_projectiles(self, room_id: int) -> list[ProjectileRecord]:
+        return await self.projectile_store.get_by_room(room_id)
 
-    async def delete_projectile(self, projectile: Projectile) -> None:
-        await self.projectile_repo.delete(projectile)
+    async def delete_projectile(self, projectile: ProjectileRecord) -> None:
+        await self.projectile_store.delete(projectile.room_id, [projectile.id])
 
     async def cleanup_old_projectiles(self, room_id: int, max_age_seconds: int = 10) -> int:
-        return await self.projectile_repo.delete_old_projectiles(room_id, max_age_seconds)
+        return await self.projectile_store.delete_old(room_id, max_age_seconds)
+
+    async def persist_room_projectiles(self, room_id: int) -> int:
+        return await self.projectile_store.persist_room(self.db, room_id)
@@ -1,11 +1,11 @@
-from datetime import datetime
-
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_password_hash, verify_password
 from app.models.player import Player
-from app.repositories.player import PlayerRepository
-from app.schemas.player import PlayerCreate, PlayerUpdate
+from app.repositories.leaderboard_cache import cache_leaderboard, get_cached_leaderboard
+from app.repositories.player import LEADERBOARD_COLUMNS, PlayerRepository
+from app.schemas.player import LeaderboardEntry, PlayerCreate, PlayerUpdate
 
 
 class PlayerService:
@@ -24,7 +24,7 @@ class PlayerService:
         player = Player(
             username=player_data.username,
             email=player_data.email,
-            hashed_password=get_password_hash(player_data.password),
+            hashed_password=await run_in_threadpool(get_password_hash, player_data.password),
         )
         return await self.repo.create(player)
 
@@ -38,14 +38,12 @@ class PlayerService:
         player = await self.repo.get_by_username_or_email(identifier)
         if not player:
             return None
-        if not verify_password(password, player.hashed_password):
+        if not await run_in_threadpool(verify_password, password, player.hashed_password):
             return None
         return player
 
-    async def record_login(self, player: Player) -> Player:
-        player.last_login_at = datetime.utcnow()
-        player.login_count += 1
-        return await self.repo.update(player)
+    async def record_login(self, player_id: int) -> Player | None:
+        return await self.repo.record_login(player_id)
 
     async def update_player(self, player: Player, player_data: PlayerUpdate) -> Player:
         if player_data.email:
@@ -55,14 +53,29 @@ class PlayerService:
             player.email = player_data.email
 
         if player_data.password:
-            player.hashed_password = get_password_hash(player_data.password)
+            player.hashed_password = await run_in_threadpool(
+                get_password_hash, player_data.password
+            )
 
         return await self.repo.update(player)
 
     async def get_leaderboard(
         self, order_by: str = "kills", skip: int = 0, limit: int = 100
-    ) -> list[Player]:
-        return await self.repo.get_leaderboard(order_by, skip, limit)
+    ) -> list[LeaderboardEntry]:
+        # Rankings only move when a game ends, so a short-lived Redis copy is enough.
+        if order_by not in LEADERBOARD_COLUMNS:
+            order_by = "kills"
+        cached = await get_cached_leaderboard(order_by, skip, limit)
+        if cached is not None:
+            return [LeaderboardEntry.model_construct(**entry) for entry in cached]
+
+        players = await self.repo.get_leaderboard(order_by, skip, limit)
+        entries = [
+            LeaderboardEntry.model_validate(player).model_copy(update={"rank": skip + i + 1})
+            for i, player in enumerate(players)
+        ]
+        await cache_leaderboard(order_by, skip, limit, [entry.model_dump() for entry in entries])
+        return entries
 
     async def update_player_stats(
         self, player: Player, kills: int = 0, deaths: int = 0, wins: int = 0, losses: int = 0
@@ -9,27 +9,30 @@ from app.repositories.room import RoomRepository
 from app.repositories.room_membership import RoomMembershipRepository
 from app.schemas.room import RoomCreate, RoomUpdate
 
+_ROOM_CODE_ALPHABET = tuple(string.ascii_uppercase + string.digits)
+_ROOM_CODE_RNG = random.Random()
+# 36^6 codes make even one collision rare; this only bounds a pathological run.
+ROOM_CODE_ATTEMPTS = 5
+
 
 class RoomService:
     def __init__(self, db: AsyncSession):
         self.room_repo = RoomRepository(db)
         self.membership_repo = RoomMembershipRepository(db)
 
-    def _generate_room_code(self) -> str:
-        return "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
+    @staticmethod
+    def _generate_room_code() -> str:
+        return "".join(_ROOM_CODE_RNG.choices(_ROOM_CODE_ALPHABET, k=6))
 
     async def create_room(self, room_data: RoomCreate, creator_id: int) -> Room:
-        code = self._generate_room_code()
-        while await self.room_repo.get_by_code(code):
-            code = self._generate_room_code()
-
-        room = Room(
-            code=code,
-            name=room_data.name,
-            max_players=room_data.max_players,
-            status=RoomStatus.WAITING,
-        )
-        room = await self.room_repo.create(room)
+        for _ in range(ROOM_CODE_ATTEMPTS):
+            room = await self.room_repo.try_insert(
+                self._generate_room_code(), room_data.name, room_data.max_players
+            )
+            if room is not None:
+                break
+        else:
+            raise ValueError("Could not allocate a room code")
 
         membership = RoomMembership(player_id=creator_id, room_id=room.id)
         await self.membership_repo.create(membership)
@@ -45,24 +48,28 @@ class RoomService:
     async def get_room_with_members(self, room_id: int) -> Room | None:
         return await self.room_repo.get_with_members(room_id)
 
+    async def get_room_with_members_by_code(self, code: str) -> Room | None:
+        return await self.room_repo.get_with_members_by_code(code)
+
     async def update_room(self, room: Room, room_data: RoomUpdate) -> Room:
-        if room_data.name is not None:
-            room.name = room_data.name
-        if room_data.status is not None:
-            room.status = room_data.status
-        if room_data.max_players is not None:
-            room.max_players = room_data.max_players
+        for name, value in room_data.model_dump(exclude_unset=True, exclude_none=True).items():
+            setattr(room, name, value)
 
         return await self.room_repo.update(room)
 
     async def delete_room(self, room: Room) -> None:
         await self.room_repo.delete(room)
 
-    async def get_available_rooms(self, skip: int = 0, limit: int = 100) -> list[Room]:
+    async def get_available_rooms(self, skip: int = 0, limit: int = 100) -> list[tuple[Room, int]]:
         return await self.room_repo.get_available_rooms(skip, limit)
 
     async def join_room(self, room_id: int, player_id: int) -> RoomMembership:
-        room = await self.room_repo.get(room_id)
+        membership = await self.room_repo.add_member(room_id, player_id)
+        if membership is not None:
+            return membership
+
+        # The join was rejected; work out why only on this slow path.
+        room = await self.room_repo.get_with_members(room_id)
         if not room:
             raise ValueError("Room not found")
 
@@ -72,21 +79,14 @@ class RoomService:
         if room.status != RoomStatus.WAITING:
             raise ValueError("Room is not accepting new players")
 
-        existing = await self.membership_repo.get_by_player_and_room(player_id, room_id)
-        if existing:
+        if await self.membership_repo.get_by_player_and_room(player_id, room_id):
             raise ValueError("Player already in room")
 
-        membership = RoomMembership(player_id=player_id, room_id=room_id)
-        return await self.membership_repo.create(membership)
+        # A seat freed up after the INSERT was rejected; report what it saw.
+        raise ValueError("Room is full")
 
     async def leave_room(self, room_id: int, player_id: int) -> None:
-        await self.membership_repo.delete_by_player_and_room(player_id, room_id)
-
-        members_count = await self.membership_repo.count_by_room(room_id)
-        if members_count == 0:
-            room = await self.room_repo.get(room_id)
-            if room:
-                await self.room_repo.delete(room)
+        await self.room_repo.remove_member(room_id, player_id)
 
     async def set_player_ready(
         self, room_id: int, player_id: int, is_ready: bool
@@ -106,8 +106,7 @@ class RoomService:
         if not room.can_start:
             raise ValueError("Room cannot be started")
 
-        memberships = await self.membership_repo.get_by_room(room_id)
-        if not all(m.is_ready for m in memberships):
+        if await self.membership_repo.has_unready(room_id):
             raise ValueError("Not all players are ready")
 
         room.status = RoomStatus.ACTIVE
@@ -3,35 +3,139 @@ WebSocket connection manager with Redis pub/sub integration for horizontal scali
 
 Tracks active connections per room, broadcasts messages to participants,
 and uses Redis pub/sub to sync messages across multiple server instances.
+Broadcasts are queued per connection and flushed on a short timer, so a burst
+of room messages reaches each client as a single batch frame. Messages are
+encoded to JSON once with orjson and sent as binary frames, so the encoded
+bytes go out without a str round-trip.
 """
 
+import asyncio
 import json
-from typing import Callable
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
+import orjson
 from fastapi import WebSocketException
 from fastapi.websockets import WebSocket
-from redis import asyncio as aioredis
-
 from app.core import get_logger
+from app.core.config import settings
 from app.schemas.ws import ErrorData, MessageType, WSMessage
+from app.ws.publisher import RoomPublisher
 
 logger = get_logger(__name__)
 
 ROOM_CHANNEL_PREFIX = "game:room:"
 
 
+def room_channel(room_code: str, message_type: MessageType) -> str:
+    """
+    Redis channel carrying one message type for a room.
+
+    Channels are sharded by type (game:room:{code}:{type}) so a subscriber that
+    only needs, say, scoreboard events can subscribe to that channel alone;
+    full participants pattern-subscribe to game:room:{code}:*.
+
+    Args:
+        room_code: Room code
+        message_type: Message event type
+
+    Returns:
+        Channel name
+    """
+    return f"{ROOM_CHANNEL_PREFIX}{room_code}:{message_type.value}"
+
+
+# Identifies this server process on the shared room channels.
+INSTANCE_ID = uuid.uuid4().hex
+
+# Messages are already encoded, so the batch envelope is assembled by concatenation.
+_BATCH_PREFIX = b'{"type":"' + MessageType.BATCH.value.encode() + b'","data":{"messages":['
+
+
+def encode_message(message_type: MessageType, data: Any) -> bytes:
+    """
+    Encode a WebSocket message envelope without building a WSMessage.
+
+    Args:
+        message_type: Message event type
+        data: Already-validated message payload, as a dict or dataclass
+
+    Returns:
+        JSON-encoded message
+    """
+    return orjson.dumps({"type": message_type, "data": data})
+
+
+def encode_json_message(message_type: MessageType, data_json: bytes) -> bytes:
+    """
+    Wrap an already JSON-encoded payload in a WebSocket message envelope.
+
+    Lets callers serialize a payload model straight to JSON without first
+    dumping it to a dict.
+
+    Args:
+        message_type: Message event type
+        data_json: JSON-encoded message payload
+
+    Returns:
+        JSON-encoded message
+    """
+    return b'{"type":"' + message_type.value.encode() + b'","data":' + data_json + b"}"
+
+
+@dataclass(slots=True)
+class RoomConnections:
+    """
+    Connections of one room as parallel websocket/player lists.
+
+    Broadcasts walk the websocket list directly; index maps each connection to
+    its slot so removal is an O(1) swap with the last entry.
+    """
+
+    websockets: list[WebSocket] = field(default_factory=list)
+    player_ids: list[int] = field(default_factory=list)
+    index: dict[WebSocket, int] = field(default_factory=dict)
+
+    def add(self, websocket: WebSocket, player_id: int):
+        slot = self.index.get(websocket)
+        if slot is not None:
+            self.player_ids[slot] = player_id
+            return
+        self.index[websocket] = len(self.websockets)
+        self.websockets.append(websocket)
+        self.player_ids.append(player_id)
+
+    def remove(self, websocket: WebSocket) -> int | None:
+        slot = self.index.pop(websocket, None)
+        if slot is None:
+            return None
+        player_id = self.player_ids[slot]
+        last_websocket = self.websockets.pop()
+        last_player_id = self.player_ids.pop()
+        if slot < len(self.websockets):
+            self.websockets[slot] = last_websocket
+            self.player_ids[slot] = last_player_id
+            self.index[last_websocket] = slot
+        return player_id
+
+
 class WSConnectionManager:
     """
     Manages WebSocket connections per room with Redis pub/sub integration.
     
-    Each room has a set of active connections. Messages are published to Redis
-    channels for distribution to other server instances.
+    Each room's active connections are held in a RoomConnections. Messages are
+    published to Redis channels for distribution to other server instances.
     """
 
-    def __init__(self, redis: aioredis.Redis):
-        self.redis = redis
-        self.active_connections: dict[str, set[WebSocket]] = {}
-        self.connection_player_map: dict[WebSocket, int] = {}
+    def __init__(self, publisher: RoomPublisher):
+        self.publisher = publisher
+        self.rooms: dict[str, RoomConnections] = {}
+        self._pending: dict[tuple[str, WebSocket], list[bytes]] = {}
+        # Index into _pending of each connection's queued update per coalesce key.
+        self._coalesced: dict[tuple[str, WebSocket], dict[int, int]] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket, room_code: str, player_id: int):
         """
@@ -43,10 +147,10 @@ class WSConnectionManager:
             player_id: Player ID
         """
         await websocket.accept()
-        if room_code not in self.active_connections:
-            self.active_connections[room_code] = set()
-        self.active_connections[room_code].add(websocket)
-        self.connection_player_map[websocket] = player_id
+        room = self.rooms.get(room_code)
+        if room is None:
+            room = self.rooms[room_code] = RoomConnections()
+        room.add(websocket, player_id)
         logger.info(
             f"Player {player_id} connected to room {room_code}",
             extra={"player_id": player_id, "room_code": room_code},
@@ -60,11 +164,14 @@ class WSConnectionManager:
             websocket: WebSocket connection
             room_code: Room code
         """
-        player_id = self.connection_player_map.pop(websocket, None)
-        if room_code in self.active_connections:
-            self.active_connections[room_code].discard(websocket)
-            if not self.active_connections[room_code]:
-                del self.active_connections[room_code]
+        player_id = None
+        self._pending.pop((room_code, websocket), None)
+        self._coalesced.pop((room_code, websocket), None)
+        room = self.rooms.get(room_code)
+        if room is not None:
+            player_id = room.remove(websocket)
+            if not room.websockets:
+                del self.rooms[room_code]
         logger.info(
             f"Player {player_id} disconnected from room {room_code}",
             extra={"player_id": player_id, "room_code": room_code},
@@ -81,35 +188,157 @@ class WSConnectionManager:
             message: Message to broadcast
             exclude_websocket: Optional connection to exclude from broadcast
         """
-        if room_code not in self.active_connections:
-            return
+        await self.broadcast_bytes(
+            room_code,
+            message.type,
+            encode_message(message.type, message.data),
+            exclude_websocket=exclude_websocket,
+        )
+
+    async def broadcast_bytes(
+        self,
+        room_code: str,
+        message_type: MessageType,
+        payload: bytes,
+        exclude_websocket: WebSocket | None = None,
+        coalesce_key: int | None = None,
+    ):
+        """
+        Broadcast a pre-encoded message to all clients in a room and publish to Redis.
+
+        The payload is encoded once by the caller and the same buffer is reused
+        for every recipient.
+
+        Args:
+            room_code: Room code
+            message_type: Message event type, selecting the Redis channel
+            payload: JSON-encoded message
+            exclude_websocket: Optional connection to exclude from broadcast
+            coalesce_key: Optional key whose still-queued message this one supersedes
+        """
+        await self.broadcast_local(room_code, payload, exclude_websocket, coalesce_key)
+        self.publish(room_code, message_type, payload)
+
+    def publish(self, room_code: str, message_type: MessageType, payload: bytes):
+        """
+        Queue a message for the room channel shared with other server instances.
+
+        The publish runs on the background RoomPublisher, so it never adds a
+        Redis round-trip to the caller.
+
+        Args:
+            room_code: Room code
+            message_type: Message event type, selecting the Redis channel
+            payload: JSON-encoded message
+        """
+        # Tag the message with this instance so the relay doesn't deliver it twice here.
+        channel = room_channel(room_code, message_type)
+        self.publisher.publish_nowait(channel, INSTANCE_ID.encode() + b" " + payload)
+
+    async def broadcast_local(
+        self,
+        room_code: str,
+        payload: bytes,
+        exclude_websocket: WebSocket | None = None,
+        coalesce_key: int | None = None,
+    ):
+        """
+        Queue an encoded message for the clients of a room connected to this instance.
 
-        message_json = message.model_dump_json()
+        Messages are sent by the next flush, which runs after
+        WS_BROADCAST_FLUSH_INTERVAL_SECONDS or immediately once a client has
+        WS_BROADCAST_MAX_BATCH messages queued. A message with a coalesce_key
+        replaces a still-queued message with the same key in place, so a client
+        only receives the latest tank state per player in each flush.
 
-        disconnected = set()
-        for websocket in self.active_connections[room_code]:
-            if exclude_websocket and websocket == exclude_websocket:
+        Args:
+            room_code: Room code
+            payload: JSON-encoded message
+            exclude_websocket: Optional connection to exclude from broadcast
+            coalesce_key: Optional key whose still-queued message this one supersedes
+        """
+        room = self.rooms.get(room_code)
+        if room is None:
+            return
+        # The sender echoing to a room it has to itself reaches no one.
+        if len(room.websockets) == 1 and room.websockets[0] is exclude_websocket:
+            return
+
+        flush_now = False
+        for websocket in room.websockets:
+            if websocket is exclude_websocket:
                 continue
-            try:
-                await websocket.send_text(message_json)
-            except Exception as e:
+            key = (room_code, websocket)
+            queued = self._pending.setdefault(key, [])
+            if coalesce_key is not None:
+                slots = self._coalesced.setdefault(key, {})
+                index = slots.get(coalesce_key)
+                if index is not None:
+                    queued[index] = payload
+                    continue
+                slots[coalesce_key] = len(queued)
+            queued.append(payload)
+            if len(queued) >= settings.WS_BROADCAST_MAX_BATCH:
+                flush_now = True
+
+        if flush_now:
+            await self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(
+                self._flush_after(settings.WS_BROADCAST_FLUSH_INTERVAL_SECONDS)
+            )
+
+    async def _flush_after(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        """
+        Send every queued message, one frame per connection.
+
+        A single queued message is sent as is; several are wrapped in a batch
+        envelope whose data.messages holds the original messages in order.
+        """
+        # A scheduled timer is still sleeping; this flush covers its messages.
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        # The lock keeps overlapping flushes from reordering a client's frames.
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            self._coalesced = {}
+            if not pending:
+                return
+
+            targets = list(pending)
+            results = await asyncio.gather(
+                *(
+                    websocket.send_bytes(self._encode_batch(pending[(room_code, websocket)]))
+                    for room_code, websocket in targets
+                ),
+                return_exceptions=True,
+            )
+
+        for (room_code, websocket), result in zip(targets, results):
+            if isinstance(result, Exception):
                 logger.error(
-                    f"Error sending message to websocket: {e}",
+                    "Error sending message to websocket: %s",
+                    result,
                     extra={"room_code": room_code},
                 )
-                disconnected.add(websocket)
+                self.disconnect(websocket, room_code)
 
-        for ws in disconnected:
-            self.disconnect(ws, room_code)
-
-        channel = f"{ROOM_CHANNEL_PREFIX}{room_code}"
-        try:
-            await self.redis.publish(channel, message_json)
-        except Exception as e:
-            logger.error(
-                f"Error publishing to Redis: {e}",
-                extra={"room_code": room_code, "channel": channel},
-            )
+    @staticmethod
+    def _encode_batch(messages: list[bytes]) -> bytes:
+        if len(messages) == 1:
+            return messages[0]
+        return _BATCH_PREFIX + b",".join(messages) + b"]}}"
 
     async def send_personal(self, websocket: WebSocket, message: WSMessage):
         """
@@ -120,7 +349,7 @@ class WSConnectionManager:
             message: Message to send
         """
         try:
-            await websocket.send_text(message.model_dump_json())
+            await websocket.send_bytes(encode_message(message.type, message.data))
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
 
@@ -151,4 +380,19 @@ class WSConnectionManager:
         Returns:
             Number of connected players
         """
-        return len(self.active_connections.get(room_code, set()))
+        room = self.rooms.get(room_code)
+        return len(room.websockets) if room is not None else 0
+
+    def is_connected(self, websocket: WebSocket, room_code: str) -> bool:
+        """
+        Check whether a connection is registered in a room.
+
+        Args:
+            websocket: WebSocket connection
+            room_code: Room code
+
+        Returns:
+            True if the connection is still registered
+        """
+        room = self.rooms.get(room_code)
+        return room is not None and websocket in room.index
@@ -0,0 +1,68 @@
+"""
+Periodic expiry of in-flight projectiles.
+
+Each room with connected players runs one background task that drops
+projectiles older than PROJECTILE_MAX_AGE_SECONDS from the Redis store on a
+fixed interval, instead of expiring them on every fire event. Rooms without
+connections run no task and cost nothing.
+"""
+
+import asyncio
+
+from redis import asyncio as aioredis
+
+from app.core import get_logger, settings
+from app.repositories.projectile_store import RedisProjectileStore
+
+logger = get_logger(__name__)
+
+
+class ProjectileSweeper:
+    """
+    Removes a room's expired projectiles periodically.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        room_id: int,
+        interval: float = settings.PROJECTILE_SWEEP_INTERVAL_SECONDS,
+        max_age_seconds: int = settings.PROJECTILE_MAX_AGE_SECONDS,
+    ):
+        self.store = RedisProjectileStore(redis)
+        self.room_id = room_id
+        self.interval = interval
+        self.max_age_seconds = max_age_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        """Start the sweep task if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the sweep task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sweep(self) -> int:
+        """
+        Drop the room's expired projectiles.
+
+        Returns:
+            Number of projectiles removed
+        """
+        return await self.store.delete_old(self.room_id, self.max_age_seconds)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error("Error sweeping projectiles: %s", e, extra={"room_id": self.room_id})
@@ -0,0 +1,112 @@
+"""
+Background publisher for cross-instance room messages.
+
+Broadcasts hand their Redis PUBLISH to a bounded in-process queue instead of
+awaiting it, so the serving coroutine never waits on a Redis round-trip for a
+result it doesn't use. A single worker drains the queue and pipelines whatever
+has accumulated into one round-trip.
+"""
+
+import asyncio
+
+from redis import asyncio as aioredis
+
+from app.core import get_logger, settings
+from app.core.redis import get_redis
+
+logger = get_logger(__name__)
+
+# Upper bound on publishes sent in one pipeline.
+PUBLISH_BATCH_SIZE = 256
+
+
+class RoomPublisher:
+    """
+    Publishes queued room messages to Redis from a background task.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        maxsize: int = settings.WS_PUBLISH_QUEUE_SIZE,
+    ):
+        self.redis = redis
+        self._queue: asyncio.Queue[tuple[str, bytes]] = asyncio.Queue(maxsize=maxsize)
+        self._task: asyncio.Task | None = None
+
+    def publish_nowait(self, channel: str, message: bytes) -> bool:
+        """
+        Queue a message for publishing without waiting for Redis.
+
+        Args:
+            channel: Redis channel
+            message: Encoded message
+
+        Returns:
+            False if the queue was full and the message was dropped
+        """
+        try:
+            self._queue.put_nowait((channel, message))
+        except asyncio.QueueFull:
+            logger.warning("Publish queue full, dropping message", extra={"channel": channel})
+            return False
+        return True
+
+    def start(self):
+        """Start the publish worker if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the publish worker and publish whatever is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            await self._publish(self._drain())
+
+    def _drain(self, first: tuple[str, bytes] | None = None) -> list[tuple[str, bytes]]:
+        batch = [first] if first is not None else []
+        while len(batch) < PUBLISH_BATCH_SIZE and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _publish(self, batch: list[tuple[str, bytes]]):
+        try:
+            if len(batch) == 1:
+                await self.redis.publish(*batch[0])
+                return
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for channel, message in batch:
+                    pipe.publish(channel, message)
+                await pipe.execute()
+        except Exception as e:
+            logger.error("Error publishing to Redis: %s", e, extra={"messages": len(batch)})
+
+    async def _run(self):
+        while True:
+            await self._publish(self._drain(await self._queue.get()))
+
+
+room_publisher: RoomPublisher | None = None
+
+
+def get_room_publisher() -> RoomPublisher:
+    """Get the process-wide room publisher, starting it on first use."""
+    global room_publisher
+    if room_publisher is None:
+        room_publisher = RoomPublisher(get_redis())
+        room_publisher.start()
+    return room_publisher
+
+
+async def close_room_publisher() -> None:
+    """Stop the room publisher, flushing any queued messages."""
+    global room_publisher
+    if room_publisher is not None:
+        await room_publisher.stop()
+        room_publisher = None
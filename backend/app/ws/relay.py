@@ -0,0 +1,95 @@
+"""
+Redis pub/sub relay for room broadcasts published by other server instances.
+
+Each worker runs a single relay that pattern-subscribes to every room channel,
+across all message types, and hands incoming messages to the local manager of that room, so players
+connected to different workers still see each other's updates.
+"""
+
+import asyncio
+from typing import Callable
+
+from redis import asyncio as aioredis
+
+from app.core import get_logger
+from app.ws.manager import INSTANCE_ID, ROOM_CHANNEL_PREFIX, WSConnectionManager
+
+logger = get_logger(__name__)
+
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+
+class RoomChannelRelay:
+    """
+    Fans out room channel messages from other instances to local WebSocket clients.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        resolve_manager: Callable[[str], WSConnectionManager | None],
+    ):
+        self.redis = redis
+        self.resolve_manager = resolve_manager
+        self._task: asyncio.Task | None = None
+        self._retry_delay = RECONNECT_INITIAL_DELAY
+
+    def start(self):
+        """Start the subscriber task if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the subscriber task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        # Resubscribe after a dropped connection instead of silently going deaf.
+        while True:
+            try:
+                await self._listen()
+            except Exception as e:
+                logger.warning(
+                    "Room relay disconnected, retrying in %.1fs: %s", self._retry_delay, e
+                )
+            await asyncio.sleep(self._retry_delay)
+            self._retry_delay = min(self._retry_delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _listen(self):
+        pubsub = self.redis.pubsub()
+        try:
+            await pubsub.psubscribe(f"{ROOM_CHANNEL_PREFIX}*")
+            async for message in pubsub.listen():
+                if message["type"] == "psubscribe":
+                    self._retry_delay = RECONNECT_INITIAL_DELAY
+                    continue
+                if message["type"] != "pmessage":
+                    continue
+                try:
+                    await self._deliver(message["channel"], message["data"])
+                except Exception as e:
+                    logger.error(
+                        "Error relaying room message: %s",
+                        e,
+                        extra={"channel": message["channel"]},
+                    )
+        finally:
+            await pubsub.aclose()
+
+    async def _deliver(self, channel: str, data: str):
+        origin, _, message_text = data.partition(" ")
+        if origin == INSTANCE_ID:
+            return
+
+        # Channels are game:room:{code}:{type}; every type is relayed the same way.
+        room_code, _, _ = channel.removeprefix(ROOM_CHANNEL_PREFIX).rpartition(":")
+        manager = self.resolve_manager(room_code)
+        if manager is not None:
+            await manager.broadcast_local(room_code, message_text.encode())
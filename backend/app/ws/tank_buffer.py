@@ -0,0 +1,100 @@
+"""
+Write-behind buffer for tank state updates.
+
+Incoming tank_state_update messages only keep the latest state per player in a
+Redis hash. A background task per room flushes the hash to PostgreSQL on a
+fixed interval, so the database sees one batched UPDATE per flush instead of
+one UPDATE per message. A flush renames the hash aside and only deletes it once
+the batch is committed, so a failed write is retried on the next flush.
+"""
+
+import asyncio
+from typing import Any
+
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import ResponseError
+
+from app.core import get_logger, settings
+from app.core.database import AsyncSessionLocal
+from app.repositories.tank_state import TankStateRepository
+
+logger = get_logger(__name__)
+
+TANK_BUFFER_PREFIX = "tank:"
+
+
+class TankStateBuffer:
+    """
+    Buffers the latest tank state per player of a room and flushes it periodically.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        room_id: int,
+        interval: float = settings.TANK_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.redis = redis
+        self.room_id = room_id
+        self.interval = interval
+        self.key = f"{TANK_BUFFER_PREFIX}{room_id}"
+        self.flushing_key = f"{self.key}:flushing"
+        self._task: asyncio.Task | None = None
+
+    async def put(self, player_id: int, state: dict[str, Any]):
+        """
+        Record the latest state for a player, replacing any unflushed one.
+
+        Args:
+            player_id: Player ID
+            state: Tank fields to persist (position, rotation, velocity, hp)
+        """
+        await self.redis.hset(self.key, str(player_id), orjson.dumps(state))
+
+    def start(self):
+        """Start the periodic flush task if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the periodic flush task and flush whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Drain the buffer and write the states to the database in one batch.
+
+        Returns:
+            Number of buffered player states written
+        """
+        # A batch left over from a failed flush goes first; it is older than the hash.
+        if not await self.redis.exists(self.flushing_key):
+            try:
+                await self.redis.rename(self.key, self.flushing_key)
+            except ResponseError:
+                # Nothing buffered since the last flush.
+                return 0
+
+        buffered = await self.redis.hgetall(self.flushing_key)
+        if buffered:
+            states = {int(player_id): orjson.loads(raw) for player_id, raw in buffered.items()}
+            async with AsyncSessionLocal() as db:
+                await TankStateRepository(db).bulk_update_states(self.room_id, states)
+        await self.redis.delete(self.flushing_key)
+        return len(buffered)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("Error flushing tank states: %s", e, extra={"room_id": self.room_id})
@@ -1,7 +1,10 @@
 import asyncio
 import random
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 
+from sqlalchemy import Row, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -16,17 +19,33 @@ from app.models.tank_state import TankState
 setup_logging()
 logger = get_logger(__name__)
 
-SAMPLE_PLAYERS = [
-    {"username": "tank_master", "email": "tank@example.com", "password": "password123"},
-    {"username": "battle_pro", "email": "battle@example.com", "password": "password123"},
-    {"username": "steel_warrior", "email": "steel@example.com", "password": "password123"},
-    {"username": "cannon_king", "email": "cannon@example.com", "password": "password123"},
-    {"username": "armor_ace", "email": "armor@example.com", "password": "password123"},
-]
-
-TANK_COLORS = ["red", "blue", "green", "yellow", "purple", "orange", "cyan", "pink"]
-
-SPAWN_POSITIONS = [
+# (username, email, password)
+SAMPLE_PLAYERS = (
+    ("tank_master", "tank@example.com", "password123"),
+    ("battle_pro", "battle@example.com", "password123"),
+    ("steel_warrior", "steel@example.com", "password123"),
+    ("cannon_king", "cannon@example.com", "password123"),
+    ("armor_ace", "armor@example.com", "password123"),
+)
+
+# (code, name, status, max_players)
+SAMPLE_ROOMS = (
+    ("ROOM01", "Beginner Arena", RoomStatus.WAITING, 8),
+    ("ROOM02", "Pro Battle Zone", RoomStatus.ACTIVE, 4),
+    ("ROOM03", "Elite Warfare", RoomStatus.WAITING, 6),
+)
+
+# (player index, room index, is_ready, tank color index)
+SAMPLE_MEMBERSHIPS = (
+    (0, 0, True, 0),
+    (1, 0, False, 1),
+    (2, 1, True, 0),
+    (3, 1, True, 1),
+)
+
+TANK_COLORS = ("red", "blue", "green", "yellow", "purple", "orange", "cyan", "pink")
+
+SPAWN_POSITIONS = (
     (100.0, 100.0),
     (700.0, 100.0),
     (100.0, 500.0),
@@ -35,137 +54,11 @@ SPAWN_POSITIONS = [
     (400.0, 500.0),
     (100.0, 300.0),
     (700.0, 300.0),
-]
-
-
-async def seed_players(db: AsyncSession) -> list[Player]:
-    logger.info("Seeding sample players...")
-    players = []
-    
-    for i, player_data in enumerate(SAMPLE_PLAYERS):
-        player = Player(
-            username=player_data["username"],
-            email=player_data["email"],
-            hashed_password=get_password_hash(player_data["password"]),
-            kills=random.randint(0, 50),
-            deaths=random.randint(0, 40),
-            wins=random.randint(0, 20),
-            losses=random.randint(0, 15),
-            games_played=random.randint(5, 35),
-        )
-        db.add(player)
-        players.append(player)
-    
-    await db.commit()
-    
-    for player in players:
-        await db.refresh(player)
-    
-    logger.info(f"Created {len(players)} sample players")
-    return players
+)
 
-
-async def seed_rooms(db: AsyncSession, players: list[Player]) -> list[Room]:
-    logger.info("Seeding sample rooms...")
-    
-    room1 = Room(
-        code="ROOM01",
-        name="Beginner Arena",
-        status=RoomStatus.WAITING,
-        max_players=8,
-    )
-    db.add(room1)
-    
-    room2 = Room(
-        code="ROOM02",
-        name="Pro Battle Zone",
-        status=RoomStatus.ACTIVE,
-        max_players=4,
-    )
-    db.add(room2)
-    
-    room3 = Room(
-        code="ROOM03",
-        name="Elite Warfare",
-        status=RoomStatus.WAITING,
-        max_players=6,
-    )
-    db.add(room3)
-    
-    await db.commit()
-    await db.refresh(room1)
-    await db.refresh(room2)
-    await db.refresh(room3)
-    
-    membership1 = RoomMembership(
-        player_id=players[0].id,
-        room_id=room1.id,
-        is_ready=True,
-        tank_color=TANK_COLORS[0],
-    )
-    db.add(membership1)
-    
-    membership2 = RoomMembership(
-        player_id=players[1].id,
-        room_id=room1.id,
-        is_ready=False,
-        tank_color=TANK_COLORS[1],
-    )
-    db.add(membership2)
-    
-    membership3 = RoomMembership(
-        player_id=players[2].id,
-        room_id=room2.id,
-        is_ready=True,
-        tank_color=TANK_COLORS[0],
-    )
-    db.add(membership3)
-    
-    membership4 = RoomMembership(
-        player_id=players[3].id,
-        room_id=room2.id,
-        is_ready=True,
-        tank_color=TANK_COLORS[1],
-    )
-    db.add(membership4)
-    
-    await db.commit()
-    
-    logger.info(f"Created 3 sample rooms with memberships")
-    return [room1, room2, room3]
-
-
-async def seed_tank_states(db: AsyncSession, players: list[Player], room: Room) -> None:
-    logger.info(f"Seeding tank states for room {room.code}...")
-    
-    tank1 = TankState(
-        player_id=players[2].id,
-        room_id=room.id,
-        position_x=SPAWN_POSITIONS[0][0],
-        position_y=SPAWN_POSITIONS[0][1],
-        rotation=45.0,
-        hp=100,
-        max_hp=100,
-    )
-    db.add(tank1)
-    
-    tank2 = TankState(
-        player_id=players[3].id,
-        room_id=room.id,
-        position_x=SPAWN_POSITIONS[1][0],
-        position_y=SPAWN_POSITIONS[1][1],
-        rotation=225.0,
-        hp=85,
-        max_hp=100,
-    )
-    db.add(tank2)
-    
-    await db.commit()
-    logger.info(f"Created tank states for active room")
-
-
-async def create_map_layout_reference() -> dict:
-    map_layout = {
+# Built once at import and shared by every caller; the top level is read-only.
+MAP_LAYOUT = MappingProxyType(
+    {
         "name": "Classic Arena",
         "width": 800,
         "height": 600,
@@ -186,15 +79,133 @@ async def create_map_layout_reference() -> dict:
             {"type": "damage", "x": 400, "y": 500},
         ],
     }
+)
+
+
+def _random_stats() -> dict:
+    kills = random.randint(0, 50)
+    deaths = random.randint(0, 40)
+    wins = random.randint(0, 20)
+    games_played = random.randint(5, 35)
+    # Same ratios as Player.refresh_ratios, without building ORM objects.
+    return {
+        "kills": kills,
+        "deaths": deaths,
+        "wins": wins,
+        "losses": random.randint(0, 15),
+        "games_played": games_played,
+        "kd_ratio": float(kills) if deaths == 0 else round(kills / deaths, 2),
+        "win_rate": round((wins / games_played) * 100, 2),
+    }
+
+
+async def seed_players(db: AsyncSession) -> list[int]:
+    logger.info("Seeding sample players...")
+    # Sample players share passwords, so each distinct one is hashed once; bcrypt
+    # releases the GIL, so those hashes run in parallel on the default thread pool.
+    # Reusing a salted hash across accounts is only acceptable for throwaway seed data.
+    passwords = list(dict.fromkeys(password for _, _, password in SAMPLE_PLAYERS))
+    hashes = dict(
+        zip(
+            passwords,
+            await asyncio.gather(
+                *(asyncio.to_thread(get_password_hash, password) for password in passwords)
+            ),
+        )
+    )
+    
+    # Seed rows need no identity tracking: one Core executemany, batched into
+    # multi-row INSERT ... RETURNING, with ids returned in parameter order.
+    result = await db.execute(
+        insert(Player).returning(Player.id, sort_by_parameter_order=True),
+        [
+            {
+                "username": username,
+                "email": email,
+                "hashed_password": hashes[password],
+                **_random_stats(),
+            }
+            for username, email, password in SAMPLE_PLAYERS
+        ],
+    )
+    player_ids = list(result.scalars())
+    
+    logger.info(f"Created {len(player_ids)} sample players")
+    return player_ids
+
+
+async def seed_rooms(db: AsyncSession, player_ids: list[int]) -> list[Row]:
+    logger.info("Seeding sample rooms...")
+    
+    result = await db.execute(
+        insert(Room).returning(
+            Room.id, Room.code, Room.status, sort_by_parameter_order=True
+        ),
+        [
+            {"code": code, "name": name, "status": status, "max_players": max_players}
+            for code, name, status, max_players in SAMPLE_ROOMS
+        ],
+    )
+    rooms = list(result.all())
+    
+    await db.execute(
+        insert(RoomMembership),
+        [
+            {
+                "player_id": player_ids[player_index],
+                "room_id": rooms[room_index].id,
+                "is_ready": is_ready,
+                "tank_color": TANK_COLORS[color_index],
+            }
+            for player_index, room_index, is_ready, color_index in SAMPLE_MEMBERSHIPS
+        ],
+    )
+    
+    logger.info(f"Created {len(rooms)} sample rooms with memberships")
+    return rooms
+
+
+async def seed_tank_states(db: AsyncSession, player_ids: list[int], room: Row) -> None:
+    logger.info(f"Seeding tank states for room {room.code}...")
+    
+    await db.execute(
+        insert(TankState),
+        [
+            {
+                "player_id": player_ids[2],
+                "room_id": room.id,
+                "position_x": SPAWN_POSITIONS[0][0],
+                "position_y": SPAWN_POSITIONS[0][1],
+                "rotation": 45.0,
+                "hp": 100,
+                "max_hp": 100,
+            },
+            {
+                "player_id": player_ids[3],
+                "room_id": room.id,
+                "position_x": SPAWN_POSITIONS[1][0],
+                "position_y": SPAWN_POSITIONS[1][1],
+                "rotation": 225.0,
+                "hp": 85,
+                "max_hp": 100,
+            },
+        ],
+    )
     
+    logger.info(f"Created tank states for active room")
+
+
+def create_map_layout_reference() -> Mapping:
+    return MAP_LAYOUT
+
+
+def log_map_layout(map_layout: Mapping) -> None:
     logger.info("Map layout reference created")
     logger.info(f"Map: {map_layout['name']}")
     logger.info(f"Size: {map_layout['width']}x{map_layout['height']}")
     logger.info(f"Spawn positions: {len(map_layout['spawn_positions'])}")
     logger.info(f"Obstacles: {len(map_layout['obstacles'])}")
     logger.info(f"Power-ups: {len(map_layout['power_ups'])}")
-    
-    return map_layout
 
 
 async def main():
@@ -203,28 +214,28 @@ async def main():
     
     async with AsyncSessionLocal() as db:
         try:
-            players = await seed_players(db)
-            rooms = await seed_rooms(db, players)
-            
-            active_room = next((r for r in rooms if r.status == RoomStatus.ACTIVE), None)
-            if active_room:
-                await seed_tank_states(db, players, active_room)
-            
-            map_layout = await create_map_layout_reference()
-            
-            logger.info("Database seeding completed successfully!")
-            logger.info("\n" + "=" * 60)
-            logger.info("SAMPLE DATA SUMMARY")
-            logger.info("=" * 60)
-            logger.info(f"Players created: {len(players)}")
-            logger.info(f"Rooms created: {len(rooms)}")
-            logger.info(f"Sample login: username='tank_master', password='password123'")
-            logger.info("=" * 60)
-            
+            # Every seed insert runs in one transaction with a single commit at the end.
+            async with db.begin():
+                player_ids = await seed_players(db)
+                rooms = await seed_rooms(db, player_ids)
+                
+                active_room = next((r for r in rooms if r.status == RoomStatus.ACTIVE), None)
+                if active_room:
+                    await seed_tank_states(db, player_ids, active_room)
         except Exception as e:
             logger.error(f"Error seeding database: {e}")
-            await db.rollback()
             raise
+    
+    log_map_layout(create_map_layout_reference())
+    
+    logger.info("Database seeding completed successfully!")
+    logger.info("\n" + "=" * 60)
+    logger.info("SAMPLE DATA SUMMARY")
+    logger.info("=" * 60)
+    logger.info(f"Players created: {len(player_ids)}")
+    logger.info(f"Rooms created: {len(rooms)}")
+    logger.info(f"Sample login: username='tank_master', password='password123'")
+    logger.info("=" * 60)
 
 
 if __name__ == "__main__":
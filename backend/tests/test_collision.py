@@ -0,0 +1,54 @@
+import random
+
+from app.game.collision import (
+    is_valid_position,
+    is_valid_projectile,
+    validate_movement,
+    validate_positions_batch,
+)
+from app.game.map import MAP_BOUNDS, OBSTACLES, TANK_RADIUS
+
+
+def brute_force_is_valid(x: float, y: float) -> bool:
+    if not (MAP_BOUNDS.min_x <= x <= MAP_BOUNDS.max_x):
+        return False
+    if not (MAP_BOUNDS.min_y <= y <= MAP_BOUNDS.max_y):
+        return False
+    return not any(obstacle.intersects_circle(x, y, TANK_RADIUS) for obstacle in OBSTACLES)
+
+
+def test_is_valid_position_matches_brute_force():
+    rng = random.Random(1234)
+    points = [(rng.uniform(-20, 820), rng.uniform(-20, 620)) for _ in range(20000)]
+    # Integer coordinates land exactly on grid cell and obstacle edges.
+    points += [(float(rng.randint(-20, 820)), float(rng.randint(-20, 620))) for _ in range(20000)]
+    for x, y in points:
+        assert is_valid_position(x, y) == brute_force_is_valid(x, y), (x, y)
+
+
+def test_is_valid_position_edges():
+    assert is_valid_position(50.0, 50.0)
+    assert is_valid_position(MAP_BOUNDS.max_x, MAP_BOUNDS.max_y)
+    assert not is_valid_position(-1.0, 50.0)
+    assert not is_valid_position(150.0, 125.0)
+    assert not is_valid_position(150.0, 100.0 - TANK_RADIUS)
+    assert is_valid_position(150.0, 100.0 - TANK_RADIUS - 0.01)
+
+
+def test_validate_positions_batch_matches_scalar():
+    rng = random.Random(99)
+    xs = [rng.uniform(-20, 820) for _ in range(5000)]
+    ys = [rng.uniform(-20, 620) for _ in range(5000)]
+    assert validate_positions_batch(xs, ys) == [is_valid_position(x, y) for x, y in zip(xs, ys)]
+    assert validate_positions_batch([], []) == []
+
+
+def test_validate_movement_limits_step():
+    assert validate_movement(50.0, 50.0, 80.0, 90.0)
+    assert not validate_movement(50.0, 50.0, 80.0, 91.0)
+    assert not validate_movement(150.0, 60.0, 150.0, 90.0)
+
+
+def test_is_valid_projectile_origin():
+    assert is_valid_projectile(50.0, 50.0, 50.0 + TANK_RADIUS * 2, 50.0)
+    assert not is_valid_projectile(50.0, 50.0, 50.0 + TANK_RADIUS * 2 + 0.01, 50.0)
@@ -9,3 +9,12 @@ async def test_health_check(client: AsyncClient):
     data = response.json()
     assert data["status"] == "healthy"
     assert "version" in data
+
+
+def test_routes_are_not_registered_twice(app):
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or {"WEBSOCKET"}:
+            key = (route.path, method)
+            assert key not in seen, f"Duplicate route {method} {route.path}"
+            seen.add(key)
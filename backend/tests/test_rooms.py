@@ -5,14 +5,15 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.room import RoomStatus
+from app.schemas.player import PlayerCreate
+from app.schemas.room import RoomCreate
+from app.services.player_service import PlayerService
 from app.services.room_service import RoomService
 
 
 @pytest.mark.asyncio
 async def test_room_service_create_room(db_session: AsyncSession):
     """Test creating a room via service."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room_data = RoomCreate(name="Test Room", max_players=4)
     room = await service.create_room(room_data, creator_id=1)
@@ -28,8 +29,6 @@ async def test_room_service_create_room(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_get_room(db_session: AsyncSession):
     """Test retrieving a room via service."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     created = await service.create_room(RoomCreate(name="Get Test"), creator_id=1)
 
@@ -42,8 +41,6 @@ async def test_room_service_get_room(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_get_by_code(db_session: AsyncSession):
     """Test retrieving a room by code via service."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     created = await service.create_room(RoomCreate(name="Code Test"), creator_id=1)
 
@@ -55,8 +52,6 @@ async def test_room_service_get_by_code(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_join_room(db_session: AsyncSession):
     """Test joining a room via service."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room = await service.create_room(RoomCreate(name="Join Test"), creator_id=1)
 
@@ -69,8 +64,6 @@ async def test_room_service_join_room(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_join_room_full(db_session: AsyncSession):
     """Test joining a full room raises error."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room = await service.create_room(RoomCreate(name="Full Test", max_players=2), creator_id=1)
 
@@ -83,8 +76,6 @@ async def test_room_service_join_room_full(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_join_room_already_member(db_session: AsyncSession):
     """Test joining same room twice raises error."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room = await service.create_room(RoomCreate(name="Duplicate Test"), creator_id=1)
 
@@ -95,8 +86,6 @@ async def test_room_service_join_room_already_member(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_leave_room(db_session: AsyncSession):
     """Test leaving a room via service."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room = await service.create_room(RoomCreate(name="Leave Test"), creator_id=1)
 
@@ -109,8 +98,6 @@ async def test_room_service_leave_room(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_set_player_ready(db_session: AsyncSession):
     """Test setting player ready status."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room = await service.create_room(RoomCreate(name="Ready Test"), creator_id=1)
 
@@ -125,8 +112,6 @@ async def test_room_service_set_player_ready(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_start_game(db_session: AsyncSession):
     """Test starting a game."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room = await service.create_room(RoomCreate(name="Start Test"), creator_id=1)
 
@@ -142,8 +127,6 @@ async def test_room_service_start_game(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_start_game_not_ready(db_session: AsyncSession):
     """Test starting game when not all players ready fails."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
     room = await service.create_room(RoomCreate(name="Not Ready Test"), creator_id=1)
 
@@ -157,8 +140,6 @@ async def test_room_service_start_game_not_ready(db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_room_service_get_available_rooms(db_session: AsyncSession):
     """Test getting available rooms."""
-    from app.schemas.room import RoomCreate
-
     service = RoomService(db_session)
 
     await service.create_room(RoomCreate(name="Available 1"), creator_id=1)
@@ -169,58 +150,23 @@ async def test_room_service_get_available_rooms(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_rest_list_rooms(client: AsyncClient, db_session: AsyncSession):
+async def test_rest_list_rooms(db_session: AsyncSession, authed_client_factory):
     """Test listing rooms via REST endpoint."""
-    from app.schemas.auth import LoginRequest
-    from app.schemas.room import RoomCreate
-    from app.services.player_service import PlayerService
-    from app.services.room_service import RoomService
-
-    player_service = PlayerService(db_session)
-    room_service = RoomService(db_session)
-
-    from app.schemas.player import PlayerCreate
-
-    player = await player_service.create_player(
-        PlayerCreate(username="testuser", email="test@example.com", password="password123")
-    )
-
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "testuser", "password": "password123"},
-    )
-    token = login.json()["access_token"]
+    player, authed = await authed_client_factory("testuser", "test@example.com")
+    await RoomService(db_session).create_room(RoomCreate(name="Test Room"), creator_id=player.id)
 
-    await room_service.create_room(RoomCreate(name="Test Room"), creator_id=player.id)
-
-    response = await client.get("/api/v1/rooms", headers={"Authorization": f"Bearer {token}"})
+    response = await authed.get("/api/v1/rooms")
     assert response.status_code == 200
     rooms = response.json()
     assert len(rooms) > 0
 
 
 @pytest.mark.asyncio
-async def test_rest_create_room(client: AsyncClient, db_session: AsyncSession):
+async def test_rest_create_room(authed_client_factory):
     """Test creating room via REST endpoint."""
-    from app.schemas.player import PlayerCreate
-    from app.services.player_service import PlayerService
+    _, authed = await authed_client_factory("creator")
 
-    player_service = PlayerService(db_session)
-    player = await player_service.create_player(
-        PlayerCreate(username="creator", email="creator@example.com", password="password123")
-    )
-
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "creator", "password": "password123"},
-    )
-    token = login.json()["access_token"]
-
-    response = await client.post(
-        "/api/v1/rooms",
-        json={"name": "My Room", "max_players": 4},
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed.post("/api/v1/rooms", json={"name": "My Room", "max_players": 4})
     assert response.status_code == 201
     room = response.json()
     assert room["name"] == "My Room"
@@ -231,11 +177,6 @@ async def test_rest_create_room(client: AsyncClient, db_session: AsyncSession):
 @pytest.mark.asyncio
 async def test_rest_get_room(client: AsyncClient, db_session: AsyncSession):
     """Test getting room details via REST endpoint."""
-    from app.schemas.player import PlayerCreate
-    from app.schemas.room import RoomCreate
-    from app.services.player_service import PlayerService
-    from app.services.room_service import RoomService
-
     player_service = PlayerService(db_session)
     room_service = RoomService(db_session)
 
@@ -252,105 +193,52 @@ async def test_rest_get_room(client: AsyncClient, db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_rest_join_room(client: AsyncClient, db_session: AsyncSession):
+async def test_rest_join_room(db_session: AsyncSession, authed_client_factory, players_factory):
     """Test joining room via REST endpoint."""
-    from app.schemas.player import PlayerCreate
-    from app.schemas.room import RoomCreate
-    from app.services.player_service import PlayerService
-    from app.services.room_service import RoomService
-
-    player_service = PlayerService(db_session)
-    room_service = RoomService(db_session)
-
-    player1 = await player_service.create_player(
-        PlayerCreate(username="player1", email="player1@example.com", password="password123")
-    )
-    player2 = await player_service.create_player(
-        PlayerCreate(username="player2", email="player2@example.com", password="password123")
+    [player1] = await players_factory("player1")
+    room = await RoomService(db_session).create_room(
+        RoomCreate(name="Join Room"), creator_id=player1.id
     )
-    room = await room_service.create_room(RoomCreate(name="Join Room"), creator_id=player1.id)
+    _, authed = await authed_client_factory("player2")
 
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "player2", "password": "password123"},
-    )
-    token = login.json()["access_token"]
-
-    response = await client.post(
-        f"/api/v1/rooms/{room.code}/join",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed.post(f"/api/v1/rooms/{room.code}/join")
     assert response.status_code == 200
     joined_room = response.json()
     assert joined_room["current_players"] == 2
 
 
 @pytest.mark.asyncio
-async def test_rest_join_full_room(client: AsyncClient, db_session: AsyncSession):
+async def test_rest_join_full_room(
+    db_session: AsyncSession, authed_client_factory, players_factory
+):
     """Test joining full room returns error."""
-    from app.schemas.player import PlayerCreate
-    from app.schemas.room import RoomCreate
-    from app.services.player_service import PlayerService
-    from app.services.room_service import RoomService
-
-    player_service = PlayerService(db_session)
     room_service = RoomService(db_session)
 
-    player1 = await player_service.create_player(
-        PlayerCreate(username="full1", email="full1@example.com", password="password123")
-    )
-    player2 = await player_service.create_player(
-        PlayerCreate(username="full2", email="full2@example.com", password="password123")
-    )
-    player3 = await player_service.create_player(
-        PlayerCreate(username="full3", email="full3@example.com", password="password123")
-    )
+    player1, player2 = await players_factory("full1", "full2")
 
     room = await room_service.create_room(
         RoomCreate(name="Full Room", max_players=2), creator_id=player1.id
     )
     await room_service.join_room(room.id, player_id=player2.id)
 
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "full3", "password": "password123"},
-    )
-    token = login.json()["access_token"]
+    _, authed = await authed_client_factory("full3")
 
-    response = await client.post(
-        f"/api/v1/rooms/{room.code}/join",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed.post(f"/api/v1/rooms/{room.code}/join")
     assert response.status_code == 400
     assert "full" in response.json()["detail"].lower()
 
 
 @pytest.mark.asyncio
-async def test_rest_leave_room(client: AsyncClient, db_session: AsyncSession):
+async def test_rest_leave_room(
+    client: AsyncClient, db_session: AsyncSession, authed_client_factory
+):
     """Test leaving room via REST endpoint."""
-    from app.schemas.player import PlayerCreate
-    from app.schemas.room import RoomCreate
-    from app.services.player_service import PlayerService
-    from app.services.room_service import RoomService
-
-    player_service = PlayerService(db_session)
-    room_service = RoomService(db_session)
-
-    player = await player_service.create_player(
-        PlayerCreate(username="leaver", email="leaver@example.com", password="password123")
-    )
-    room = await room_service.create_room(RoomCreate(name="Leave Room"), creator_id=player.id)
-
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "leaver", "password": "password123"},
+    player, authed = await authed_client_factory("leaver")
+    room = await RoomService(db_session).create_room(
+        RoomCreate(name="Leave Room"), creator_id=player.id
     )
-    token = login.json()["access_token"]
 
-    response = await client.post(
-        f"/api/v1/rooms/{room.code}/leave",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed.post(f"/api/v1/rooms/{room.code}/leave")
     assert response.status_code == 204
 
     get_room = await client.get(f"/api/v1/rooms/{room.code}")
@@ -358,52 +246,25 @@ async def test_rest_leave_room(client: AsyncClient, db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_rest_set_ready(client: AsyncClient, db_session: AsyncSession):
+async def test_rest_set_ready(db_session: AsyncSession, authed_client_factory):
     """Test setting ready status via REST endpoint."""
-    from app.schemas.player import PlayerCreate
-    from app.schemas.room import RoomCreate
-    from app.services.player_service import PlayerService
-    from app.services.room_service import RoomService
-
-    player_service = PlayerService(db_session)
-    room_service = RoomService(db_session)
-
-    player = await player_service.create_player(
-        PlayerCreate(username="ready_player", email="ready@example.com", password="password123")
-    )
-    room = await room_service.create_room(RoomCreate(name="Ready Room"), creator_id=player.id)
-
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "ready_player", "password": "password123"},
+    player, authed = await authed_client_factory("ready_player", "ready@example.com")
+    room = await RoomService(db_session).create_room(
+        RoomCreate(name="Ready Room"), creator_id=player.id
     )
-    token = login.json()["access_token"]
 
-    response = await client.post(
-        f"/api/v1/rooms/{room.code}/ready/true",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed.post(f"/api/v1/rooms/{room.code}/ready/true")
     assert response.status_code == 200
     assert response.json()["status"] == "ready"
 
 
 @pytest.mark.asyncio
-async def test_rest_start_game(client: AsyncClient, db_session: AsyncSession):
+async def test_rest_start_game(db_session: AsyncSession, authed_client_factory, players_factory):
     """Test starting game via REST endpoint."""
-    from app.schemas.player import PlayerCreate
-    from app.schemas.room import RoomCreate
-    from app.services.player_service import PlayerService
-    from app.services.room_service import RoomService
-
-    player_service = PlayerService(db_session)
     room_service = RoomService(db_session)
 
-    player1 = await player_service.create_player(
-        PlayerCreate(username="start1", email="start1@example.com", password="password123")
-    )
-    player2 = await player_service.create_player(
-        PlayerCreate(username="start2", email="start2@example.com", password="password123")
-    )
+    player1, authed = await authed_client_factory("start1")
+    [player2] = await players_factory("start2")
 
     room = await room_service.create_room(RoomCreate(name="Start Room"), creator_id=player1.id)
     await room_service.join_room(room.id, player_id=player2.id)
@@ -411,16 +272,7 @@ async def test_rest_start_game(client: AsyncClient, db_session: AsyncSession):
     await room_service.set_player_ready(room.id, player_id=player1.id, is_ready=True)
     await room_service.set_player_ready(room.id, player_id=player2.id, is_ready=True)
 
-    login = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "start1", "password": "password123"},
-    )
-    token = login.json()["access_token"]
-
-    response = await client.post(
-        f"/api/v1/rooms/{room.code}/start",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    response = await authed.post(f"/api/v1/rooms/{room.code}/start")
     assert response.status_code == 200
     started_room = response.json()
     assert started_room["status"] == "active"
@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from jose import jwt
+
+from app.core.config import settings
+from app.core.security import create_access_token, decode_token, decode_token_fast
+
+
+def test_decode_token_fast_matches_jose():
+    token = create_access_token({"sub": "42"})
+    assert decode_token_fast(token) == decode_token(token)
+
+
+def test_decode_token_fast_rejects_invalid_tokens():
+    token = create_access_token({"sub": "42"})
+    header, payload, signature = token.split(".")
+    other_key = jwt.encode({"sub": "42"}, "not-the-secret", algorithm=settings.ALGORITHM)
+    expired = create_access_token({"sub": "42"}, expires_delta=timedelta(minutes=-1))
+
+    assert decode_token_fast(f"{header}.{payload}.{signature[:-2]}AA") is None
+    assert decode_token_fast(other_key) is None
+    assert decode_token_fast(expired) is None
+    assert decode_token_fast("not-a-jwt") is None
+    assert decode_token_fast(f"{header}.{payload}") is None
@@ -0,0 +1,80 @@
+import json
+
+from app.ws.manager import RoomConnections, WSConnectionManager
+from app.ws.publisher import RoomPublisher
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.frames: list[bytes] = []
+
+    async def accept(self):
+        pass
+
+    async def send_bytes(self, data: bytes):
+        self.frames.append(data)
+
+
+async def test_broadcast_local_coalesces_messages_into_one_frame():
+    manager = WSConnectionManager(RoomPublisher(redis=None))
+    sender, receiver = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(sender, "ROOM1", 1)
+    await manager.connect(receiver, "ROOM1", 2)
+
+    await manager.broadcast_local("ROOM1", b'{"type":"fire","data":{"n":1}}')
+    await manager.broadcast_local("ROOM1", b'{"type":"fire","data":{"n":2}}', sender)
+    await manager.flush()
+
+    assert sender.frames == [b'{"type":"fire","data":{"n":1}}']
+    [frame] = receiver.frames
+    batch = json.loads(frame)
+    assert batch["type"] == "batch"
+    assert [m["data"]["n"] for m in batch["data"]["messages"]] == [1, 2]
+
+
+async def test_publish_queue_drops_messages_when_full():
+    publisher = RoomPublisher(redis=None, maxsize=1)
+    assert publisher.publish_nowait("game:room:ROOM1", b"first")
+    assert not publisher.publish_nowait("game:room:ROOM1", b"second")
+
+
+async def test_broadcast_local_keeps_latest_tank_update_per_player():
+    manager = WSConnectionManager(RoomPublisher(redis=None))
+    receiver = FakeWebSocket()
+    await manager.connect(receiver, "ROOM1", 2)
+
+    await manager.broadcast_local("ROOM1", b'{"n":1}', coalesce_key=1)
+    await manager.broadcast_local("ROOM1", b'{"n":2}')
+    await manager.broadcast_local("ROOM1", b'{"n":3}', coalesce_key=1)
+    await manager.broadcast_local("ROOM1", b'{"n":4}', coalesce_key=3)
+    await manager.flush()
+
+    [frame] = receiver.frames
+    assert [m["n"] for m in json.loads(frame)["data"]["messages"]] == [3, 2, 4]
+
+
+def test_room_connections_swap_remove_keeps_index_consistent():
+    room = RoomConnections()
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for player_id, websocket in enumerate(sockets):
+        room.add(websocket, player_id)
+
+    assert room.remove(sockets[0]) == 0
+    assert room.remove(sockets[0]) is None
+    assert room.websockets == [sockets[2], sockets[1]]
+    assert room.player_ids == [2, 1]
+    assert {ws: room.websockets[slot] for ws, slot in room.index.items()} == {
+        sockets[1]: sockets[1],
+        sockets[2]: sockets[2],
+    }
+
+
+async def test_broadcast_local_skips_room_with_only_the_sender():
+    manager = WSConnectionManager(RoomPublisher(redis=None))
+    sender = FakeWebSocket()
+    await manager.connect(sender, "ROOM1", 1)
+
+    await manager.broadcast_local("ROOM1", b'{"n":1}', sender)
+
+    assert manager._pending == {}
+    assert manager._flush_task is None
@@ -11,6 +11,7 @@ class WebSocketService {
   private reconnectInterval = 1000;
   private isConnecting = false;
   private currentRoomCode: string | null = null;
+  private decoder = new TextDecoder();
 
   connect(roomCode: string): Promise<void> {
     return new Promise((resolve, reject) => {
@@ -32,6 +33,8 @@ class WebSocketService {
       
       try {
         this.ws = new WebSocket(wsUrl);
+        // Server messages arrive as binary frames holding UTF-8 JSON.
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
           console.log('WebSocket connected');
@@ -42,7 +45,8 @@ class WebSocketService {
 
         this.ws.onmessage = (event) => {
           try {
-            const message: WSMessage = JSON.parse(event.data);
+            const text = typeof event.data === 'string' ? event.data : this.decoder.decode(event.data);
+            const message: WSMessage = JSON.parse(text);
             this.handleMessage(message);
           } catch (error) {
             console.error('Failed to parse WebSocket message:', error);
@@ -118,6 +122,12 @@ class WebSocketService {
   }
 
   private handleMessage(message: WSMessage): void {
+    // The server coalesces queued room messages into a single batch frame.
+    if (message.type === 'batch') {
+      message.data.messages.forEach((queued: WSMessage) => this.handleMessage(queued));
+      return;
+    }
+
     const handlers = this.messageHandlers.get(message.type) || [];
     handlers.forEach(handler => handler(message.data));
 